@@ -0,0 +1,265 @@
+"""Headless benchmark suite for the video tagger.
+
+Generates a synthetic video corpus and synthetic tag dictionaries, drives a
+real VideoTagger window on the offscreen Qt platform and times the hot paths:
+directory scan, thumbnail latency, navigation round-trip, per-keystroke
+update_ui cost, corpus statistics and CSV export throughput. Results are
+written as JSON so runs from different versions can be compared:
+
+    python benchmark.py --output new.json --compare old.json
+"""
+import os
+
+# Must be set before Qt is imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox
+
+import video_tagger
+from video_tagger import VideoTagger, scan_video_directory
+
+CODEC_EXTENSIONS = {"mp4v": ".mp4", "avc1": ".mp4", "MJPG": ".avi", "XVID": ".avi"}
+
+
+def generate_video_corpus(directory, count, resolution=(1280, 720), codec="mp4v", frames=60, fps=25):
+    """Write count synthetic videos with moving, textured content to directory"""
+    os.makedirs(directory, exist_ok=True)
+    width, height = resolution
+    extension = CODEC_EXTENSIONS.get(codec, ".mp4")
+    fourcc = cv2.VideoWriter_fourcc(*codec)
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    paths = []
+    for n in range(count):
+        path = os.path.join(directory, f"synthetic_{n:05d}{extension}")
+        writer = cv2.VideoWriter(path, fourcc, fps, (width, height))
+        if not writer.isOpened():
+            raise RuntimeError(f"cv2.VideoWriter cannot encode {codec} to {path}")
+        noise = rng.integers(0, 64, (height, width, 1), dtype=np.uint8)
+        for i in range(frames):
+            # A short fade-in followed by a drifting gradient with texture
+            fade = min(1.0, i / max(1, frames // 5))
+            base = (x + y + i * 4 + n * 17) % 256
+            frame = np.dstack([base, np.roll(base, i, axis=1), 255 - base]).astype(np.uint8)
+            frame = cv2.add(frame, np.repeat(noise, 3, axis=2))
+            writer.write((frame * fade).astype(np.uint8))
+        writer.release()
+        paths.append(path)
+    return paths
+
+
+def generate_tag_records(count, tagger, seed=0):
+    """Return (tags, tag_paths) dictionaries with count synthetic structured records"""
+    rng = random.Random(seed)
+    names = ["Alice", "Bob", "Carol", "Dan", "Eve", "Frank", "Grace", "Heidi"]
+    tags = {}
+    tag_paths = {}
+    for n in range(count):
+        key = f"{rng.getrandbits(32):x}-{rng.getrandbits(128):032x}"
+        movements = rng.sample(tagger.movement_types, rng.randint(0, 3))
+        actions = rng.sample(tagger.action_types, rng.randint(0, 4))
+        tags[key] = tagger.vocabulary.encode_record({
+            'people': ', '.join(rng.sample(names, rng.randint(0, 3))),
+            'moments': f"0:00:{rng.randint(0, 59):02d}.{rng.randint(0, 999):03d} - Event {n}",
+            'caption': f"Synthetic clip number {n}",
+            'location': rng.choice(tagger.location_classes),
+            'actions': ', '.join(actions),
+            'movement': ', '.join(movements),
+            'movement_description': '',
+            'content_movement': rng.choice(tagger.content_movement_types),
+            'shot_type': rng.choice(tagger.shot_types),
+            'handheld': rng.choice(tagger.handheld_options),
+            'depth_of_field': rng.choice(tagger.depth_of_field_options),
+            'color_scale': rng.choice(tagger.color_scale_options),
+            'color_scale_description': '',
+            'general_tags': 'synthetic',
+        })
+        tag_paths[key] = f"/synthetic/{n:07d}.mp4"
+    return tags, tag_paths
+
+
+def summarize(samples_ms, **extra):
+    ordered = sorted(samples_ms)
+    result = {
+        'n': len(ordered),
+        'mean_ms': statistics.fmean(ordered),
+        'median_ms': statistics.median(ordered),
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'min_ms': ordered[0],
+        'max_ms': ordered[-1],
+    }
+    result.update(extra)
+    return result
+
+
+def time_calls(fn, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run_benchmarks(args, app, corpus_dir, export_dir):
+    results = {}
+    tagger = VideoTagger()
+
+    # Dialogs would block a headless run
+    QFileDialog.getExistingDirectory = staticmethod(lambda *a, **k: corpus_dir)
+    QMessageBox.information = staticmethod(lambda *a, **k: None)
+    QMessageBox.warning = staticmethod(lambda *a, **k: None)
+
+    results['scan_video_directory'] = summarize(
+        time_calls(lambda: scan_video_directory(corpus_dir), args.repeat), videos=args.videos)
+
+    def select():
+        tagger.select_directory()
+        app.processEvents()
+
+    def reset_caches():
+        tagger.fingerprints = video_tagger.FingerprintIndex()
+        tagger.thumbnail_cache.clear()
+        tagger.poster_frames.clear()
+
+    results['select_directory_cold'] = summarize(
+        time_calls(select, args.repeat, setup=reset_caches), videos=args.videos)
+    results['select_directory_warm'] = summarize(time_calls(select, args.repeat), videos=args.videos)
+
+    def reset_thumbnails():
+        tagger.thumbnail_cache.clear()
+        tagger.poster_frames.clear()
+
+    results['show_thumbnail_cold'] = summarize(
+        time_calls(tagger.show_thumbnail, args.repeat, setup=reset_thumbnails))
+    results['show_thumbnail_warm'] = summarize(time_calls(tagger.show_thumbnail, args.repeat))
+
+    def round_trip():
+        tagger.next_video()
+        tagger.previous_video()
+        app.processEvents()
+
+    if len(tagger.video_files) > 1:
+        results['navigation_round_trip'] = summarize(time_calls(round_trip, args.repeat))
+
+    for count in args.tag_records:
+        tags, tag_paths = generate_tag_records(count, tagger)
+        tagger.tags = tags
+        tagger.tag_paths = tag_paths
+        tagger.corpus = video_tagger.CorpusColumns(tagger.vocabulary)
+        for key, record in tags.items():
+            tagger.corpus.store(key, record)
+
+        keystrokes = iter(range(10 ** 9))
+        results[f'update_ui_keystroke_{count}'] = summarize(
+            time_calls(lambda: tagger.people_input.setText(f"Person {next(keystrokes)}"), args.repeat),
+            tag_records=count)
+
+        results[f'corpus_stats_{count}'] = summarize(
+            time_calls(lambda: tagger.corpus.table().report(), max(1, args.repeat // 5)), tag_records=count)
+
+        export_path = os.path.join(export_dir, f"export_{count}.csv")
+        QFileDialog.getSaveFileName = staticmethod(lambda *a, **k: (export_path, "CSV Files (*.csv)"))
+        samples = time_calls(tagger.export_to_csv, max(1, args.repeat // 5))
+        results[f'export_to_csv_{count}'] = summarize(
+            samples, tag_records=count,
+            records_per_second=count / (statistics.median(samples) / 1000),
+            bytes=os.path.getsize(export_path))
+
+    tagger.close()
+    return results
+
+
+def environment_info():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'opencv': cv2.__version__,
+        'numpy': np.__version__,
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def compare(results, baseline):
+    """Print the median change of each metric relative to a baseline results file"""
+    print(f"{'metric':40} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, metric in results['metrics'].items():
+        old = baseline['metrics'].get(name)
+        if not old:
+            continue
+        change = metric['median_ms'] / old['median_ms'] - 1 if old['median_ms'] else 0.0
+        print(f"{name:40} {old['median_ms']:10.2f}ms {metric['median_ms']:10.2f}ms {change:+8.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the video tagger on a synthetic corpus")
+    parser.add_argument("--videos", type=int, default=20, help="number of synthetic videos")
+    parser.add_argument("--resolution", default="1280x720", help="WIDTHxHEIGHT of synthetic videos")
+    parser.add_argument("--codec", default="mp4v", help="FourCC passed to cv2.VideoWriter")
+    parser.add_argument("--frames", type=int, default=60, help="frames per synthetic video")
+    parser.add_argument("--tag-records", default="10000,100000",
+                        help="comma-separated synthetic tag dictionary sizes (e.g. 10000,100000,1000000)")
+    parser.add_argument("--repeat", type=int, default=20, help="samples per metric")
+    parser.add_argument("--corpus-dir", help="reuse or keep the synthetic corpus in this directory")
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON results to compare against")
+    args = parser.parse_args()
+    args.tag_records = [int(n) for n in args.tag_records.split(",") if n]
+    width, height = (int(n) for n in args.resolution.lower().split("x"))
+
+    app = QApplication(sys.argv)
+    work_dir = tempfile.mkdtemp(prefix="video_tagger_bench_")
+    corpus_dir = args.corpus_dir or os.path.join(work_dir, "corpus")
+    try:
+        if not os.path.isdir(corpus_dir) or not scan_video_directory(corpus_dir):
+            start = time.perf_counter()
+            generate_video_corpus(corpus_dir, args.videos, (width, height), args.codec, args.frames)
+            print(f"Generated {args.videos} videos in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+        results = {
+            'environment': environment_info(),
+            'parameters': {
+                'videos': args.videos, 'resolution': args.resolution, 'codec': args.codec,
+                'frames': args.frames, 'tag_records': args.tag_records, 'repeat': args.repeat,
+            },
+            'metrics': run_benchmarks(args, app, corpus_dir, work_dir),
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Corpus statistics over one or more tag CSV exports.
+
+Interns the categorical and list fields into integer codes against the
+tagger's option lists, then reports label distributions, co-occurrence of
+camera movements and actions, and per-annotator coverage:
+
+    python corpus_stats.py alice.csv bob.csv --json stats.json
+
+Each CSV counts as one annotator (its file name) unless it has an
+``annotator`` column.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from video_tagger import CATEGORICAL_FIELDS, LIST_FIELDS, CorpusTable, TagVocabulary
+
+# Few distinct values each: parsed straight into categoricals, whose codes CorpusTable uses as is
+CODED_COLUMNS = CATEGORICAL_FIELDS + LIST_FIELDS + ('annotator',)
+
+
+def load_exports(csv_paths):
+    dtypes = defaultdict(lambda: str, {column: 'category' for column in CODED_COLUMNS})
+    frames = []
+    for path in csv_paths:
+        df = pd.read_csv(path, dtype=dtypes, keep_default_na=False)
+        if 'annotator' not in df:
+            annotator = os.path.splitext(os.path.basename(path))[0]
+            df['annotator'] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), [annotator])
+        frames.append(df)
+    # Shared categories keep the columns categorical through concat
+    for column in CODED_COLUMNS:
+        present = [df for df in frames if column in df]
+        if present:
+            categories = union_categoricals([df[column] for df in present], sort_categories=True).categories
+            for df in present:
+                df[column] = df[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def stats_json(table):
+    return {
+        'records': table.size,
+        'distributions': {field: table.distribution(field).to_dict() for field in CATEGORICAL_FIELDS + LIST_FIELDS},
+        'co_occurrence': {field: table.co_occurrence(field).to_dict(orient='split') for field in LIST_FIELDS},
+        'coverage': table.coverage().to_dict(orient='index'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Label distributions, co-occurrence and coverage for tag exports")
+    parser.add_argument("csv", nargs="+", help="CSV files written by Export to CSV")
+    parser.add_argument("--top", type=int, default=10, help="labels and pairs listed per field")
+    parser.add_argument("--json", help="also write the full statistics as JSON to this file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    df = load_exports(args.csv)
+    loaded = time.perf_counter()
+    table = CorpusTable.from_frame(df, TagVocabulary())
+    report = table.report(args.top)
+    done = time.perf_counter()
+
+    print(report)
+    print(f"\nLoaded {len(df)} records in {loaded - start:.2f}s, computed statistics in {done - loaded:.2f}s",
+          file=sys.stderr)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(stats_json(table), f, indent=2, default=int)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+"""Package exported tags into sharded WebDataset-style tar files for training.
+
+Reads the CSV written by "Export to CSV", parses the free-text key moments
+into structured segments and streams samples into size-bounded tar shards:
+
+    <key>.json          tag record plus parsed segments
+    <key>.poster.jpg    poster frame
+    <key>.seg003_1.jpg  optional frames sampled from each segment
+
+Records are sorted by key and produced by a parallel worker pool whose results
+are consumed in order, so the same input always yields byte-identical shards:
+
+    python dataset_packager.py tags.csv dataset/ --shard-size 1GB --frames-per-segment 2
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import pandas as pd
+
+from video_tagger import PosterFrameSelector, THUMBNAIL_SIZE, downscale_frame, parse_timestamp
+
+# "0:01:30.250 - Label", "01:30 - Label"; needs a colon so plain numbers in labels are left alone
+MOMENT_PATTERN = re.compile(r'(?<![\d:.])(\d{1,3}(?::\d{1,2}){1,2}(?:\.\d{1,3})?)\s*[-–]\s*')
+SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+
+def parse_key_moments(text):
+    """Parse key moments text into [{'start_ms', 'end_ms', 'label'}] sorted by start time
+
+    Each segment ends where the next one starts; the last has end_ms None.
+    """
+    matches = list(MOMENT_PATTERN.finditer(text or ''))
+    segments = []
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        start_ms = parse_timestamp(match.group(1))
+        if start_ms is None:
+            continue
+        label_end = next_match.start() if next_match else len(text)
+        label = text[match.end():label_end].strip().rstrip(',;').strip()
+        segments.append({'start_ms': start_ms, 'end_ms': None, 'label': label})
+    segments.sort(key=lambda segment: segment['start_ms'])
+    for segment, following in zip(segments, segments[1:]):
+        segment['end_ms'] = following['start_ms']
+    return segments
+
+
+def parse_size(text):
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*', text, re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid size: {text}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def sample_key(record):
+    """Stable WebDataset key: the content fingerprint when exported, else a hash of the path"""
+    fingerprint = record.get('fingerprint')
+    if fingerprint:
+        return fingerprint
+    return hashlib.sha1(record['file_path'].encode('utf-8')).hexdigest()
+
+
+def encode_jpeg(rgb_frame, quality):
+    ok, data = cv2.imencode('.jpg', cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR), [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return data.tobytes() if ok else None
+
+
+class SampleProducer:
+    """Builds the tar members for one record; safe to call from several threads"""
+
+    def __init__(self, frames_per_segment=0, size=THUMBNAIL_SIZE, jpeg_quality=90):
+        self.frames_per_segment = frames_per_segment
+        self.size = size
+        self.jpeg_quality = jpeg_quality
+        self.poster_frames = PosterFrameSelector(size)
+
+    def __call__(self, record):
+        key = sample_key(record)
+        segments = parse_key_moments(record.get('key_moments', ''))
+        files = {}
+        video_path = record['file_path']
+        duration_ms = None
+
+        if os.path.exists(video_path):
+            try:
+                poster = self.poster_frames.poster_frame(video_path)
+                if poster is not None:
+                    files['poster.jpg'] = encode_jpeg(poster, self.jpeg_quality)
+                if self.frames_per_segment and segments:
+                    duration_ms = self._add_segment_frames(video_path, segments, files)
+            except Exception as e:
+                print(f"Error reading frames from {video_path}: {e}", file=sys.stderr)
+        else:
+            print(f"Missing video, packing tags only: {video_path}", file=sys.stderr)
+
+        metadata = dict(record)
+        metadata['segments'] = segments
+        metadata['duration_ms'] = duration_ms
+        files['json'] = json.dumps(metadata, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return key, {name: data for name, data in files.items() if data is not None}
+
+    def _add_segment_frames(self, video_path, segments, files):
+        cap = cv2.VideoCapture(video_path)
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+            frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+            duration_ms = int(frame_count * 1000 / fps) if frame_count > 0 else None
+            for n, segment in enumerate(segments):
+                start = segment['start_ms']
+                end = segment['end_ms'] or duration_ms or start
+                for i in range(self.frames_per_segment):
+                    # Evenly spaced inside the segment, away from the cut points
+                    position = start + (end - start) * (i + 0.5) / self.frames_per_segment
+                    cap.set(cv2.CAP_PROP_POS_MSEC, position)
+                    ret, frame = cap.read()
+                    if ret:
+                        files[f'seg{n:03d}_{i}.jpg'] = encode_jpeg(downscale_frame(frame, self.size), self.jpeg_quality)
+            return duration_ms
+        finally:
+            cap.release()
+
+
+def tar_member_bytes(data_size):
+    """Bytes one tar member takes up: a 512-byte header plus data padded to whole blocks"""
+    return tarfile.BLOCKSIZE + -(-data_size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+
+
+def tar_archive_bytes(members_bytes):
+    """Final size of a tar holding members_bytes of members, with the end-of-archive blocks and record padding"""
+    return -(-(members_bytes + 2 * tarfile.BLOCKSIZE) // tarfile.RECORDSIZE) * tarfile.RECORDSIZE
+
+
+class ShardWriter:
+    """Writes samples into tar shards, starting a new shard before one would pass max_bytes
+
+    A sample too large to fit in an empty shard still gets written, alone in a
+    shard of its own, with a warning.
+    """
+
+    def __init__(self, output_dir, max_bytes, prefix='shard'):
+        self.output_dir = output_dir
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+        self.shards = []
+        self._tar = None
+        self._size = 0
+        self._count = 0
+        os.makedirs(output_dir, exist_ok=True)
+        # A re-pack may produce fewer shards than the last run
+        for name in os.listdir(output_dir):
+            if name.startswith(f"{prefix}-") and name.endswith(".tar"):
+                os.remove(os.path.join(output_dir, name))
+
+    def write(self, key, files):
+        sample_bytes = sum(tar_member_bytes(len(data)) for data in files.values())
+        if self._tar is None or (self._count and tar_archive_bytes(self._size + sample_bytes) > self.max_bytes):
+            self._open_next()
+        if tar_archive_bytes(sample_bytes) > self.max_bytes:
+            print(f"Sample {key} needs {tar_archive_bytes(sample_bytes)} bytes, more than the shard size "
+                  f"of {self.max_bytes}; {self.shards[-1]['path']} will exceed it", file=sys.stderr)
+        for name, data in sorted(files.items()):
+            info = tarfile.TarInfo(f"{key}.{name}")
+            info.size = len(data)
+            info.mode = 0o644
+            info.mtime = 0  # Fixed metadata keeps re-packed shards byte-identical
+            self._tar.addfile(info, io.BytesIO(data))
+        self._size += sample_bytes
+        self._count += 1
+
+    def _open_next(self):
+        self._close_current()
+        path = os.path.join(self.output_dir, f"{self.prefix}-{len(self.shards):06d}.tar")
+        self._tar = tarfile.open(path, 'w', format=tarfile.USTAR_FORMAT)
+        self.shards.append({'path': os.path.basename(path), 'samples': 0})
+        self._size = 0
+        self._count = 0
+
+    def _close_current(self):
+        if self._tar is not None:
+            self._tar.close()
+            self.shards[-1]['samples'] = self._count
+            self.shards[-1]['bytes'] = os.path.getsize(os.path.join(self.output_dir, self.shards[-1]['path']))
+            self._tar = None
+
+    def close(self):
+        self._close_current()
+
+
+def ordered_parallel_map(fn, items, workers, window=None):
+    """Like executor.map, but keeps at most window items in flight so huge inputs stream"""
+    window = window or workers * 4
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="packager") as executor:
+        pending = []
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def load_records(csv_path):
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    if 'file_path' not in df.columns:
+        raise ValueError(f"{csv_path} has no file_path column; is it a tag export?")
+    return df.to_dict('records')
+
+
+def pack_dataset(records, output_dir, shard_size=1024 ** 3, frames_per_segment=0, workers=8,
+                 size=THUMBNAIL_SIZE, jpeg_quality=90):
+    """Pack tag records into shards in output_dir and write index.json; returns the index"""
+    records = sorted(records, key=sample_key)
+    producer = SampleProducer(frames_per_segment, size, jpeg_quality)
+    writer = ShardWriter(output_dir, shard_size)
+    start = time.perf_counter()
+    try:
+        for key, files in ordered_parallel_map(producer, records, workers):
+            writer.write(key, files)
+    finally:
+        writer.close()
+
+    index = {
+        'samples': len(records),
+        'shard_size': shard_size,
+        'frames_per_segment': frames_per_segment,
+        'shards': writer.shards,
+    }
+    with open(os.path.join(output_dir, 'index.json'), 'w') as f:
+        json.dump(index, f, indent=2)
+    print(f"Packed {len(records)} samples into {len(writer.shards)} shard(s) "
+          f"in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Package exported video tags into WebDataset-style tar shards")
+    parser.add_argument("csv", help="CSV file written by Export to CSV")
+    parser.add_argument("output_dir", help="directory to write shards and index.json to")
+    parser.add_argument("--shard-size", type=parse_size, default=parse_size("1GB"), help="maximum shard size (e.g. 512MB)")
+    parser.add_argument("--frames-per-segment", type=int, default=0, help="frames sampled from each key moment segment")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="parallel producer threads")
+    parser.add_argument("--resolution", default=f"{THUMBNAIL_SIZE[0]}x{THUMBNAIL_SIZE[1]}",
+                        help="bounding box for poster and sampled frames")
+    parser.add_argument("--jpeg-quality", type=int, default=90)
+    args = parser.parse_args()
+    size = tuple(int(n) for n in args.resolution.lower().split("x"))
+
+    pack_dataset(load_records(args.csv), args.output_dir, args.shard_size, args.frames_per_segment,
+                 args.workers, size, args.jpeg_quality)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+from video_tagger import (CATEGORICAL_FIELDS, LIST_FIELDS, LOCATION_CLASSES, TAG_FIELDS, CorpusColumns,
+                          CorpusTable, TagVocabulary)
+
+
+def make_record(**fields):
+    record = {field: '' for field in TAG_FIELDS}
+    record.update(fields)
+    return record
+
+
+def test_vocabulary_round_trip():
+    vocabulary = TagVocabulary()
+    record = make_record(location='Kitchen', actions='Walking, Cooking', movement='Pan Left',
+                         shot_type='Close-Up', caption='A chef at work')
+    encoded = vocabulary.encode_record(record)
+    assert isinstance(encoded['location'], int) and encoded['location'] > 0
+    assert isinstance(encoded['actions'], tuple) and len(encoded['actions']) == 2
+    assert encoded['handheld'] == 0 and encoded['movement_description'] == ''
+    assert vocabulary.decode_record(encoded) == record
+
+
+def test_vocabulary_codes_are_seeded_and_custom_values_appended():
+    first, second = TagVocabulary(), TagVocabulary()
+    assert first.encode('location', LOCATION_CLASSES[3]) == second.encode('location', LOCATION_CLASSES[3])
+    size = len(first.values['location'])
+    assert first.encode('location', 'Moon Base') == size
+    assert first.encode('location', 'Moon Base') == size
+    assert first.decode('location', size) == 'Moon Base'
+    assert first.encode('location', '') == 0
+
+
+def test_vocabulary_normalizes_list_formatting():
+    vocabulary = TagVocabulary()
+    record = make_record(actions=' Walking ,, Talking,')
+    assert vocabulary.decode_record(vocabulary.encode_record(record)) == TagVocabulary.normalize_record(record)
+    assert TagVocabulary.normalize_record(record)['actions'] == 'Walking, Talking'
+
+
+def test_decode_passes_through_plain_values():
+    record = make_record(location='Kitchen', actions='Walking')
+    assert TagVocabulary().decode_record(record) == record
+
+
+RECORDS = [
+    make_record(location='Kitchen', actions='Walking, Talking', movement='Pan Left', people='Ann'),
+    make_record(location='Kitchen', actions='Walking', caption='x'),
+    make_record(location='Office', actions='Walking, Talking', movement='Pan Left, Zoom In'),
+    make_record(general_tags='untyped'),
+]
+
+
+def table_from_columns(records):
+    vocabulary = TagVocabulary()
+    columns = CorpusColumns(vocabulary, capacity=2)
+    for n, record in enumerate(records):
+        columns.store(n, vocabulary.encode_record(record))
+    return columns.table()
+
+
+def test_columns_and_frame_agree():
+    from_columns = table_from_columns(RECORDS)
+    from_frame = CorpusTable.from_frame(pd.DataFrame(RECORDS), TagVocabulary())
+    assert from_columns.report() == from_frame.report()
+
+
+def test_statistics():
+    table = table_from_columns(RECORDS)
+    assert table.size == 4
+    assert table.distribution('location').to_dict() == {'Kitchen': 2, 'Office': 1}
+    assert table.distribution('actions').to_dict() == {'Walking': 3, 'Talking': 2}
+    co_occurrence = table.co_occurrence('actions')
+    assert co_occurrence.loc['Walking', 'Talking'] == 2
+    assert co_occurrence.loc['Walking', 'Walking'] == 3
+    coverage = table.coverage().iloc[0]
+    assert coverage['records'] == 4
+    assert coverage['location'] == 0.75
+    assert coverage['people'] == 0.25
+    assert coverage['movement'] == 0.5
+
+
+def test_store_overwrites_existing_key():
+    vocabulary = TagVocabulary()
+    columns = CorpusColumns(vocabulary)
+    columns.store('a', vocabulary.encode_record(make_record(location='Kitchen', actions='Walking')))
+    columns.store('a', vocabulary.encode_record(make_record(location='Office')))
+    table = columns.table()
+    assert len(columns) == table.size == 1
+    assert table.distribution('location').to_dict() == {'Office': 1}
+    assert table.distribution('actions').empty
+
+
+def test_frame_with_categoricals_missing_values_and_annotators():
+    df = pd.DataFrame(RECORDS)
+    df['annotator'] = ['bob', 'alice', 'bob', 'alice']
+    for field in CATEGORICAL_FIELDS + LIST_FIELDS + ('annotator',):
+        df[field] = df[field].astype('category')
+    df.loc[3, 'caption'] = np.nan
+    df = df.drop(columns=['people'])
+    table = CorpusTable.from_frame(df, TagVocabulary())
+    assert table.distribution('actions').to_dict() == {'Walking': 3, 'Talking': 2}
+    coverage = table.coverage()
+    assert list(coverage.index) == ['alice', 'bob']
+    assert coverage.loc['alice', 'caption'] == 0.5
+    assert coverage['people'].sum() == 0
+
+
+def test_many_distinct_free_text_actions_stay_sparse():
+    # Every record has its own action, which used to mean a values x values matrix
+    count = 20000
+    records = [make_record(location='Kitchen', actions=f'Walking, chef chops item {n}, Walking') for n in range(count)]
+    from_columns = table_from_columns(records)
+    from_frame = CorpusTable.from_frame(pd.DataFrame(records), TagVocabulary())
+    assert from_columns.report() == from_frame.report()
+    distribution = from_columns.distribution('actions')
+    assert len(distribution) == count + 1 and distribution['Walking'] == count
+    pairs = from_columns.pair_counts('actions', top=3)
+    assert len(pairs) == 3 and set(pairs) == {1}
+    co_occurrence = from_columns.co_occurrence('actions', top=5)
+    assert co_occurrence.shape == (5, 5)
+    assert co_occurrence.loc['Walking', 'Walking'] == count
+    assert co_occurrence.loc['Walking', 'chef chops item 0'] == 1
@@ -0,0 +1,81 @@
+import os
+import tarfile
+
+import pytest
+
+from dataset_packager import ShardWriter, parse_key_moments, parse_size, tar_archive_bytes
+
+
+def test_parse_key_moments():
+    text = "0:00:05.000 - Door opens, 0:01:30.250 - Car arrives; 0:00:45 - Dog barks"
+    assert parse_key_moments(text) == [
+        {'start_ms': 5000, 'end_ms': 45000, 'label': 'Door opens'},
+        {'start_ms': 45000, 'end_ms': 90250, 'label': 'Dog barks'},
+        {'start_ms': 90250, 'end_ms': None, 'label': 'Car arrives'},
+    ]
+
+
+def test_parse_key_moments_ignores_plain_numbers_and_bad_timestamps():
+    assert parse_key_moments("Take 2 - wide") == []
+    assert parse_key_moments("") == []
+    assert parse_key_moments(None) == []
+    assert parse_key_moments("1:75 - Out of range, 0:10 - Fine") == [
+        {'start_ms': 10000, 'end_ms': None, 'label': 'Fine'},
+    ]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("512", 512), ("1KB", 1024), ("1.5 MiB", 1536 * 1024), ("2g", 2 * 1024 ** 3),
+])
+def test_parse_size(text, expected):
+    assert parse_size(text) == expected
+
+
+def write_samples(output_dir, max_bytes, sizes):
+    writer = ShardWriter(str(output_dir), max_bytes)
+    for n, size in enumerate(sizes):
+        writer.write(f"{n:04d}", {'json': b'{}', 'poster.jpg': bytes(size)})
+    writer.close()
+    return writer.shards
+
+
+def test_shard_writer_respects_max_bytes(tmp_path):
+    max_bytes = 64 * 1024
+    shards = write_samples(tmp_path, max_bytes, [5000 + 997 * n for n in range(40)])
+    assert len(shards) > 1
+    assert sum(shard['samples'] for shard in shards) == 40
+    for shard in shards:
+        path = os.path.join(tmp_path, shard['path'])
+        assert shard['bytes'] == os.path.getsize(path) <= max_bytes
+        with tarfile.open(path) as tar:
+            assert len(tar.getnames()) == 2 * shard['samples']
+
+
+def test_shard_writer_isolates_oversized_sample(tmp_path, capsys):
+    shards = write_samples(tmp_path, 20 * 1024, [1000, 50000, 1000])
+    assert [shard['samples'] for shard in shards] == [1, 1, 1]
+    assert shards[1]['bytes'] > 20 * 1024
+    assert "0001" in capsys.readouterr().err
+
+
+def test_shard_writer_is_deterministic(tmp_path):
+    sizes = [3000, 7000, 100, 40000]
+    first = write_samples(tmp_path / "a", 32 * 1024, sizes)
+    second = write_samples(tmp_path / "b", 32 * 1024, sizes)
+    assert first == second
+    for shard in first:
+        with open(tmp_path / "a" / shard['path'], 'rb') as a, open(tmp_path / "b" / shard['path'], 'rb') as b:
+            assert a.read() == b.read()
+
+
+def test_shard_writer_removes_stale_shards(tmp_path):
+    write_samples(tmp_path, 16 * 1024, [8000] * 6)
+    shards = write_samples(tmp_path, 1024 ** 2, [8000] * 6)
+    assert sorted(name for name in os.listdir(tmp_path) if name.endswith('.tar')) == [shards[0]['path']]
+
+
+def test_tar_archive_bytes_matches_tarfile(tmp_path):
+    path = tmp_path / "x.tar"
+    with tarfile.open(path, 'w', format=tarfile.USTAR_FORMAT) as tar:
+        pass
+    assert os.path.getsize(path) == tar_archive_bytes(0)
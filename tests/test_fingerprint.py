@@ -0,0 +1,72 @@
+import os
+
+from video_tagger import FINGERPRINT_BLOCK_SIZE, FingerprintIndex, compute_fingerprint
+
+BLOCK = FINGERPRINT_BLOCK_SIZE
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_small_file_hashes_whole_content(tmp_path):
+    data = os.urandom(2 * BLOCK)
+    first = compute_fingerprint(write(tmp_path / "a.mp4", data))
+    assert first == compute_fingerprint(write(tmp_path / "renamed.mov", data))
+    assert first.startswith(f"{len(data):x}-")
+    # Any byte counts while the whole file is hashed
+    changed = bytearray(data)
+    changed[BLOCK + 7] ^= 1
+    assert compute_fingerprint(write(tmp_path / "b.mp4", bytes(changed))) != first
+
+
+def test_large_file_samples_head_middle_and_tail(tmp_path):
+    size = 10 * BLOCK
+    data = bytearray(os.urandom(size))
+    first = compute_fingerprint(write(tmp_path / "a.mp4", bytes(data)))
+
+    # Bytes outside the three sampled blocks are not read
+    unsampled = bytearray(data)
+    unsampled[2 * BLOCK] ^= 1
+    assert compute_fingerprint(write(tmp_path / "b.mp4", bytes(unsampled))) == first
+
+    for offset in (0, (size - BLOCK) // 2 + 3, size - 1):
+        sampled = bytearray(data)
+        sampled[offset] ^= 1
+        assert compute_fingerprint(write(tmp_path / "c.mp4", bytes(sampled))) != first
+
+
+def test_size_is_part_of_the_fingerprint(tmp_path):
+    data = os.urandom(10 * BLOCK)
+    padded = data[:5 * BLOCK] + bytes(BLOCK) + data[5 * BLOCK:]
+    assert compute_fingerprint(write(tmp_path / "a.mp4", data)) != compute_fingerprint(
+        write(tmp_path / "b.mp4", padded))
+
+
+def test_index_caches_by_path_size_and_mtime(tmp_path, monkeypatch):
+    path = write(tmp_path / "a.mp4", b'x' * 100)
+    calls = []
+    real = compute_fingerprint
+    monkeypatch.setattr("video_tagger.compute_fingerprint", lambda *args: calls.append(args) or real(*args))
+
+    index = FingerprintIndex()
+    first = index.fingerprint(path)
+    assert index.fingerprint(path) == first
+    assert len(calls) == 1
+
+    # Same size, new mtime: recomputed
+    with open(path, 'r+b') as f:
+        f.write(b'y')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    assert index.fingerprint(path) != first
+    assert len(calls) == 2
+
+
+def test_fingerprint_many_skips_unreadable_files(tmp_path):
+    paths = [write(tmp_path / f"{n}.mp4", bytes([n]) * 1000) for n in range(5)]
+    missing = str(tmp_path / "gone.mp4")
+    result = FingerprintIndex(workers=2).fingerprint_many(paths + [missing])
+    assert list(result) == paths
+    assert len(set(result.values())) == 5
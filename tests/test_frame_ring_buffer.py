@@ -0,0 +1,140 @@
+import math
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+import video_tagger
+from benchmark import generate_video_corpus
+from video_tagger import FrameRingBuffer, downscale_frame
+
+FRAMES = 150
+FPS = 25
+SIZE = (160, 120)
+
+
+@pytest.fixture(scope="module")
+def clip(tmp_path_factory):
+    path, = generate_video_corpus(str(tmp_path_factory.mktemp("clip")), 1, (320, 240), frames=FRAMES, fps=FPS)
+    cap = cv2.VideoCapture(path)
+    reference = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        reference.append(downscale_frame(frame, SIZE))
+    cap.release()
+    assert len(reference) == FRAMES
+    return path, reference
+
+
+@pytest.fixture
+def make_buffer(clip):
+    buffers = []
+
+    def make(position_ms=0, capacity=20):
+        buffer = FrameRingBuffer(clip[0], capacity=capacity, size=SIZE)
+        assert buffer.start(position_ms)
+        buffers.append(buffer)
+        return buffer
+
+    yield make
+    for buffer in buffers:
+        buffer.stop()
+
+
+def wait_current(buffer, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        current = buffer.current()
+        if current is not None:
+            return current
+        time.sleep(0.005)
+    raise AssertionError("frame never decoded")
+
+
+def assert_frame(buffer, reference, index):
+    frame_index, timestamp_ms, frame = wait_current(buffer)
+    assert frame_index == index
+    assert timestamp_ms == pytest.approx(index * 1000 / FPS, abs=1)
+    assert np.array_equal(frame, reference[index])
+
+
+def test_steps_forward_through_and_past_the_window(clip, make_buffer):
+    buffer = make_buffer(capacity=20)
+    for index in range(45):
+        assert_frame(buffer, clip[1], index)
+        buffer.step(1)
+
+
+def test_steps_back_within_window_and_refills_behind_it(clip, make_buffer):
+    buffer = make_buffer(position_ms=100 * 1000 / FPS, capacity=20)
+    assert_frame(buffer, clip[1], 100)
+    for index in range(99, 90, -1):
+        buffer.step(-1)
+        assert_frame(buffer, clip[1], index)
+    buffer.step(-30)  # Well behind the buffered window
+    assert_frame(buffer, clip[1], 61)
+    buffer.step(-1)
+    assert_frame(buffer, clip[1], 60)
+
+
+def test_far_jumps(clip, make_buffer):
+    buffer = make_buffer(capacity=20)
+    assert_frame(buffer, clip[1], 0)
+    buffer.seek(130 * 1000 / FPS)
+    assert_frame(buffer, clip[1], 130)
+    buffer.seek(12 * 1000 / FPS)
+    assert_frame(buffer, clip[1], 12)
+    buffer.step(70)
+    assert_frame(buffer, clip[1], 82)
+
+
+def test_clamps_at_both_ends(clip, make_buffer):
+    buffer = make_buffer(capacity=20)
+    buffer.step(-5)
+    assert_frame(buffer, clip[1], 0)
+    buffer.seek(10 ** 9)
+    assert_frame(buffer, clip[1], FRAMES - 1)
+    buffer.step(5)
+    assert_frame(buffer, clip[1], FRAMES - 1)
+    assert not buffer.exhausted()  # The last real frame is still there to show
+
+
+def test_position_ms_follows_cursor(clip, make_buffer):
+    buffer = make_buffer(position_ms=2000, capacity=20)
+    assert_frame(buffer, clip[1], 50)
+    assert buffer.position_ms() == pytest.approx(2000, abs=1)
+
+
+class NanCapture:
+    def __init__(self, path):
+        pass
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        return math.nan
+
+    def set(self, prop, value):
+        return True
+
+    def read(self):
+        return False, None
+
+    def release(self):
+        pass
+
+
+def test_start_survives_non_finite_stream_properties(monkeypatch):
+    monkeypatch.setattr(video_tagger.cv2, "VideoCapture", NanCapture)
+    buffer = FrameRingBuffer("broken.mp4", capacity=10)
+    try:
+        assert buffer.start(1000)
+        assert buffer.fps == 25.0 and buffer.frame_count == 0
+        buffer.seek(2000)
+        assert buffer.current() is None
+    finally:
+        buffer.stop()
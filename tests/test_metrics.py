@@ -0,0 +1,50 @@
+import pytest
+
+from video_tagger import LatencyHistogram, Metrics
+
+
+def test_percentile_of_empty_histogram():
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+def test_percentile_returns_bucket_upper_bound():
+    histogram = LatencyHistogram()
+    for elapsed_ms in [0.3] * 50 + [3.0] * 45 + [40.0] * 5:
+        histogram.record(elapsed_ms)
+    assert histogram.percentile(0.5) == 0.5
+    assert histogram.percentile(0.9) == 5
+    assert histogram.percentile(0.95) == 5
+    assert histogram.percentile(0.99) == 40.0  # Capped at the largest sample
+    assert histogram.percentile(1.0) == 40.0
+
+
+def test_percentile_beyond_last_bound_is_max():
+    histogram = LatencyHistogram()
+    histogram.record(1.0)
+    histogram.record(30000.0)
+    assert histogram.percentile(1.0) == 30000.0
+    assert histogram.counts[-1] == 1
+
+
+def test_sample_on_bound_lands_in_that_bucket():
+    histogram = LatencyHistogram()
+    histogram.record(1)
+    assert histogram.snapshot()['buckets']['1'] == 1
+
+
+def test_snapshot():
+    histogram = LatencyHistogram()
+    for elapsed_ms in (2.0, 4.0, 6.0):
+        histogram.record(elapsed_ms)
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 3
+    assert snapshot['mean_ms'] == pytest.approx(4.0)
+    assert snapshot['max_ms'] == 6.0
+    assert sum(snapshot['buckets'].values()) == 3
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    with metrics.time('update_ui'):
+        pass
+    assert metrics.snapshot() == {}
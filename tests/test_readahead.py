@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+from video_tagger import ReadAheadCache
+
+
+@pytest.fixture
+def clips(tmp_path):
+    source = tmp_path / "nfs"
+    source.mkdir()
+    paths = []
+    for n in range(4):
+        path = source / f"clip{n}.mp4"
+        path.write_bytes(bytes([n]) * 300_000)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+
+    def make(max_bytes):
+        cache = ReadAheadCache(str(tmp_path / "cache"), max_bytes=max_bytes, workers=1)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.shutdown()
+
+
+def wait(cache):
+    # One worker runs tasks in order, so this returns once earlier copies are done
+    cache._executor.submit(lambda: None).result()
+
+
+def cached(cache, paths):
+    return [path for path in paths if cache.local_path(path)]
+
+
+def test_copies_are_served_locally(clips, make_cache):
+    cache = make_cache(10 ** 7)
+    cache.prefetch(clips[:2])
+    wait(cache)
+    local = cache.local_path(clips[0])
+    assert local and local != clips[0]
+    with open(local, 'rb') as f:
+        assert f.read() == bytes([0]) * 300_000
+    assert cache.local_path(clips[3]) is None
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_prefetch_stops_at_budget(clips, make_cache):
+    cache = make_cache(700_000)
+    cache.prefetch(clips)
+    wait(cache)
+    assert cache.stats()['bytes_copied'] == 600_000
+    assert cached(cache, clips) == clips[:2]
+
+
+def test_budget_includes_current_clip(clips, make_cache):
+    cache = make_cache(700_000)
+    cache.prefetch(clips[:1])
+    wait(cache)
+    cache.prefetch(clips[1:], current=clips[0])
+    wait(cache)
+    assert cached(cache, clips) == clips[:2]
+
+
+def test_eviction_spares_current_and_queued(clips, make_cache):
+    cache = make_cache(700_000)
+    cache.prefetch(clips[:2])
+    wait(cache)
+    # Moving on to clip1: clip0 is no longer needed and makes room for clip2
+    cache.prefetch(clips[2:], current=clips[1])
+    wait(cache)
+    assert cached(cache, clips) == clips[1:3]
+    assert cache.stats()['cached_bytes'] == 600_000
+
+
+def test_least_recently_used_is_evicted_first(clips, make_cache):
+    cache = make_cache(1_000_000)
+    cache.prefetch(clips[:3])
+    wait(cache)
+    assert cache.local_path(clips[0])  # clip1 is now the oldest entry
+    cache.prefetch(clips[3:], current=clips[2])
+    wait(cache)
+    assert cached(cache, clips) == [clips[0], clips[2], clips[3]]
+
+
+def test_changed_or_deleted_copies_are_misses(clips, make_cache):
+    cache = make_cache(10 ** 7)
+    cache.prefetch(clips[:2])
+    wait(cache)
+    os.remove(cache.local_path(clips[0]))
+    assert cache.local_path(clips[0]) is None
+    with open(clips[1], 'ab') as f:
+        f.write(b'more')
+    assert cache.local_path(clips[1]) is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_shutdown_removes_only_own_files(tmp_path, clips, make_cache):
+    root = tmp_path / "cache"
+    root.mkdir()
+    (root / "precious.mov").write_bytes(b'keep')
+    cache = make_cache(10 ** 7)
+    cache.prefetch(clips[:1])
+    wait(cache)
+    cache.shutdown()
+    assert os.listdir(root) == ["precious.mov"]
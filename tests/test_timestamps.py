@@ -0,0 +1,40 @@
+import pytest
+
+from video_tagger import format_timestamp, parse_timestamp
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("0:01:30.250", 90250),
+    ("1:02:03", 3723000),
+    ("01:30", 90000),
+    ("45", 45000),
+    ("12.5", 12500),
+    (" 0:00:00.001 ", 1),
+    ("120", 120000),
+    ("90:00", 5400000),
+])
+def test_parse_timestamp(text, expected):
+    assert parse_timestamp(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "", "abc", "1:2:3:4", "-1:30", "1:-30", "-5",
+    "1:60", "1:00:60", "1:75:00", "nan", "inf", "1:nan", "1.5:30",
+])
+def test_parse_timestamp_rejects_malformed(text):
+    assert parse_timestamp(text) is None
+
+
+@pytest.mark.parametrize("ms, expected", [
+    (0, "0:00:00.000"),
+    (90250, "0:01:30.250"),
+    (3723004, "1:02:03.004"),
+    (1234.6, "0:00:01.235"),
+])
+def test_format_timestamp(ms, expected):
+    assert format_timestamp(ms) == expected
+
+
+@pytest.mark.parametrize("ms", [0, 1, 59999, 90250, 3723004, 36000000])
+def test_timestamp_round_trip(ms):
+    assert parse_timestamp(format_timestamp(ms)) == ms
@@ -1,19 +1,1135 @@
 import sys
 import os
 import cv2
+import numpy as np
 import pandas as pd
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QLabel, QTextEdit, 
                             QFileDialog, QMessageBox, QProgressBar, QSlider,
                             QComboBox, QLineEdit, QCheckBox, QGroupBox, QScrollArea,
-                            QListWidget, QListWidgetItem, QSplitter, QFrame)
-from PyQt6.QtCore import Qt, QTimer, QUrl
+                            QListWidget, QListWidgetItem, QSplitter, QFrame,
+                            QDialog, QListView, QAbstractItemView, QFormLayout)
+from PyQt6.QtCore import Qt, QTimer, QUrl, QFileSystemWatcher, QAbstractListModel, QModelIndex, QSize
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QImage, QPixmap, QShortcut, QKeySequence
 import csv
 import json
-from datetime import timedelta
+import bisect
+import cProfile
+import hashlib
+import math
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv')
+THUMBNAIL_SIZE = (640, 480)
+FINGERPRINT_BLOCK_SIZE = 64 * 1024
+TAG_FIELDS = ('people', 'moments', 'caption', 'location', 'actions', 'movement',
+              'movement_description', 'content_movement', 'shot_type', 'handheld',
+              'depth_of_field', 'color_scale', 'color_scale_description', 'general_tags')
+
+# Predefined tagging options
+LOCATION_CLASSES = [
+    "Indoor", "Outdoor", "Office", "Home", "Street", "Park", "Restaurant",
+    "Gym", "Studio", "Classroom", "Conference Room", "Kitchen", "Bedroom",
+    "Bathroom", "Garage", "Garden", "Beach", "Mountain", "Forest", "Urban",
+    "Rural", "Suburban", "Industrial", "Commercial", "Residential"
+]
+
+ACTION_TYPES = [
+    "Walking", "Running", "Sitting", "Standing", "Talking", "Listening",
+    "Cooking", "Eating", "Drinking", "Working", "Reading", "Writing",
+    "Typing", "Exercising", "Dancing", "Singing", "Playing", "Teaching",
+    "Learning", "Presenting", "Meeting", "Shopping", "Cleaning", "Driving",
+    "Cycling", "Swimming", "Lifting", "Carrying", "Opening", "Closing"
+]
+
+MOVEMENT_TYPES = [
+    "Static", "Pan Left", "Pan Right", "Tilt Up", "Tilt Down", "Tilt Left", "Tilt Right", "Zoom In",
+    "Zoom Out", "Dolly In", "Dolly Out", "Tracking Left", "Tracking Right", "Crane Up", "Crane Down",
+    "Handheld", "Steadicam", "Drone", "Aerial", "Other"
+]
+
+SHOT_TYPES = [
+    "Extreme Long Shot", "Long Shot", "Full Shot", "Medium Long Shot",
+    "Medium Shot", "Medium Close-Up", "Close-Up", "Extreme Close-Up",
+    "Two Shot", "Three Shot", "Group Shot", "Over-the-Shoulder",
+    "Point of View", "Low Angle", "High Angle", "Eye Level", "Bird's Eye",
+    "Worm's Eye", "Dutch Angle", "Profile Shot", "Frontal Shot"
+]
+
+# Content movement types
+CONTENT_MOVEMENT_TYPES = [
+    "High", "Medium", "Low", "No movement"
+]
+
+# Handheld camera options
+HANDHELD_OPTIONS = [
+    "Yes", "No", "Partially", "Uncertain"
+]
+
+# Depth of field options
+DEPTH_OF_FIELD_OPTIONS = [
+    "Shallow", "Medium", "Deep", "Very Deep", "Variable", "Uncertain"
+]
+
+# Color scale options
+COLOR_SCALE_OPTIONS = [
+    "Color", "Black & White", "Sepia", "Monochrome", "High Contrast",
+    "Low Saturation", "High Saturation", "Warm Tone", "Cool Tone",
+    "Neutral", "Vintage", "Cinematic", "Other"
+]
+
+
+def scan_video_directory(directory):
+    """Return a {path: (inode, size, mtime_ns)} mapping for every supported video in directory"""
+    snapshot = {}
+    # Size and mtime go along with the inode because ext4 happily hands a
+    # just-freed inode to the next file written, so the inode alone can make
+    # "delete a.mp4, write b.mp4" look like a rename
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(VIDEO_EXTENSIONS) and entry.is_file():
+                stat = entry.stat()
+                snapshot[entry.path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def format_timestamp(position_ms):
+    """Format a position as H:MM:SS.mmm, the key-moment format with millisecond precision"""
+    hours, rest = divmod(int(round(position_ms)), 3600000)
+    minutes, rest = divmod(rest, 60000)
+    seconds, millis = divmod(rest, 1000)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+
+def parse_timestamp(text):
+    """Parse H:MM:SS[.mmm], MM:SS[.mmm] or SS[.mmm] into milliseconds; None if malformed
+
+    Negative, non-finite and out-of-range fields (minutes or seconds of 60 or
+    more after the leading field) are malformed, and only the last field may
+    have a fraction.
+    """
+    parts = text.strip().split(':')
+    if not 1 <= len(parts) <= 3:
+        return None
+    try:
+        values = [float(part) for part in parts]
+    except ValueError:
+        return None
+    seconds = 0.0
+    for i, value in enumerate(values):
+        if not math.isfinite(value) or value < 0:
+            return None
+        if i and value >= 60:
+            return None
+        if i < len(values) - 1 and not value.is_integer():
+            return None
+        seconds = seconds * 60 + value
+    return int(round(seconds * 1000))
+
+
+def downscale_frame(frame, size):
+    """Shrink a BGR frame to fit within size, keeping its aspect ratio, and convert to RGB"""
+    h, w = frame.shape[:2]
+    scale = min(size[0] / w, size[1] / h, 1.0)
+    if scale < 1.0:
+        frame = cv2.resize(frame, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+def score_poster_frame(frame):
+    """Score a BGR frame as a poster candidate; returns (score, clearly_good)
+
+    Combines sharpness (Laplacian variance), exposure and histogram entropy on
+    a small grayscale copy. Black, white and flat frames such as fades and
+    slates score low.
+    """
+    h, w = frame.shape[:2]
+    small = cv2.resize(frame, (160, max(1, h * 160 // w)), interpolation=cv2.INTER_AREA)
+    gray = small.astype(np.float32) @ np.array([0.114, 0.587, 0.299], dtype=np.float32)
+    
+    brightness = float(gray.mean()) / 255
+    laplacian = (4 * gray[1:-1, 1:-1] - gray[:-2, 1:-1] - gray[2:, 1:-1]
+                 - gray[1:-1, :-2] - gray[1:-1, 2:])
+    sharpness = float(laplacian.var())
+    histogram = np.bincount(gray.astype(np.uint8).ravel(), minlength=256) / gray.size
+    histogram = histogram[histogram > 0]
+    entropy = float(-(histogram * np.log2(histogram)).sum())
+    
+    exposure = max(0.0, 1 - abs(brightness - 0.5) * 2)
+    score = 0.4 * entropy / 8 + 0.4 * min(sharpness / 1000, 1.0) + 0.2 * exposure
+    if brightness < 0.06 or brightness > 0.94:
+        score *= 0.1
+    clearly_good = entropy > 6.0 and sharpness > 150 and 0.15 < brightness < 0.85
+    return score, clearly_good
+
+
+class PosterFrameSelector:
+    """Picks a representative poster frame per video and remembers which frame it chose"""
+
+    # Fractions of the video's length tried as poster candidates, in order
+    CANDIDATE_POSITIONS = (0.1, 0.3, 0.5, 0.7, 0.9)
+
+    def __init__(self, size=THUMBNAIL_SIZE):
+        self.size = size
+        self._indices = {}  # cache key -> chosen frame index
+        self._lock = threading.Lock()
+
+    def poster_frame(self, video_path, key=None):
+        """Return the poster frame of video_path as an RGB array fitted to size, or None"""
+        if key is None:
+            st = os.stat(video_path)
+            key = (video_path, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            index = self._indices.get(key)
+        
+        cap = cv2.VideoCapture(video_path)
+        try:
+            if index is not None:
+                # Chosen before: a single seek and decode
+                if index:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+                ret, frame = cap.read()
+                if ret:
+                    return downscale_frame(frame, self.size)
+            
+            index, frame = self._select(cap)
+            if frame is None:
+                return None
+            with self._lock:
+                self._indices[key] = index
+            return downscale_frame(frame, self.size)
+        finally:
+            cap.release()
+
+    def clear(self):
+        with self._lock:
+            self._indices.clear()
+
+    def _select(self, cap):
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        best = None
+        if frame_count > 1:
+            for position in self.CANDIDATE_POSITIONS:
+                index = int(position * (frame_count - 1))
+                # A seek and a full decode per candidate, so stop as soon as one is clearly good
+                cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+                ret, frame = cap.read()
+                if not ret:
+                    continue
+                score, clearly_good = score_poster_frame(frame)
+                if best is None or score > best[0]:
+                    best = (score, index, frame)
+                if clearly_good:
+                    break
+        if best is not None:
+            return best[1], best[2]
+        
+        # Unknown length or unseekable stream: fall back to the first frame
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        ret, frame = cap.read()
+        return (0, frame) if ret else (None, None)
+
+
+def compute_fingerprint(video_path, size=None):
+    """Sampled content fingerprint: file size plus a hash of the head, middle and tail blocks
+
+    Reads at most three small blocks regardless of file size, so it stays cheap
+    on multi-gigabyte files and network mounts while surviving moves and renames.
+    """
+    if size is None:
+        size = os.path.getsize(video_path)
+    block = FINGERPRINT_BLOCK_SIZE
+    digest = hashlib.blake2b(digest_size=16)
+    with open(video_path, 'rb') as f:
+        if size <= 3 * block:
+            digest.update(f.read())
+        else:
+            for offset in (0, (size - block) // 2, size - block):
+                f.seek(offset)
+                digest.update(f.read(block))
+    return f"{size:x}-{digest.hexdigest()}"
+
+
+class FingerprintIndex:
+    """Caches content fingerprints by (path, size, mtime) and computes them in parallel"""
+
+    def __init__(self, workers=8):
+        self.workers = workers
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def fingerprint(self, video_path):
+        st = os.stat(video_path)
+        key = (video_path, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            fingerprint = self._fingerprints.get(key)
+        if fingerprint is None:
+            fingerprint = compute_fingerprint(video_path, st.st_size)
+            with self._lock:
+                self._fingerprints[key] = fingerprint
+        return fingerprint
+
+    def fingerprint_many(self, video_paths):
+        """Return {path: fingerprint} for video_paths, skipping unreadable files"""
+        def safe_fingerprint(video_path):
+            try:
+                return self.fingerprint(video_path)
+            except OSError as e:
+                print(f"Error fingerprinting {video_path}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="fingerprint") as executor:
+            fingerprints = executor.map(safe_fingerprint, video_paths)
+            return {path: fp for path, fp in zip(video_paths, fingerprints) if fp is not None}
+
+
+# Tag fields interned into integer codes; list fields hold comma-separated values
+CATEGORICAL_FIELDS = ('location', 'content_movement', 'shot_type', 'handheld', 'depth_of_field', 'color_scale')
+LIST_FIELDS = ('movement', 'actions')
+
+
+def split_list_value(text):
+    return [item.strip() for item in text.split(',') if item.strip()] if text else []
+
+
+class TagVocabulary:
+    """Interns categorical tag values into integer codes
+
+    Codes are seeded from the predefined option lists so they are stable
+    between sessions, with code 0 reserved for an empty value. Custom entries
+    are appended as they are first seen. Encoded records keep an int per
+    categorical field and a tuple of ints per list field.
+    """
+
+    def __init__(self):
+        options = {
+            'location': LOCATION_CLASSES,
+            'content_movement': CONTENT_MOVEMENT_TYPES,
+            'shot_type': SHOT_TYPES,
+            'handheld': HANDHELD_OPTIONS,
+            'depth_of_field': DEPTH_OF_FIELD_OPTIONS,
+            'color_scale': COLOR_SCALE_OPTIONS,
+            'movement': MOVEMENT_TYPES,
+            'actions': ACTION_TYPES,
+        }
+        self.values = {field: [''] for field in options}
+        self.codes = {field: {'': 0} for field in options}
+        for field, field_options in options.items():
+            for value in field_options:
+                self.encode(field, value)
+
+    def encode(self, field, value):
+        codes = self.codes[field]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.values[field])
+            self.values[field].append(value)
+        return code
+
+    def decode(self, field, code):
+        return self.values[field][code]
+
+    def encode_record(self, record):
+        encoded = dict(record)
+        for field in CATEGORICAL_FIELDS:
+            encoded[field] = self.encode(field, record.get(field, ''))
+        for field in LIST_FIELDS:
+            encoded[field] = tuple(self.encode(field, item) for item in split_list_value(record.get(field, '')))
+        return encoded
+
+    def decode_record(self, record):
+        decoded = dict(record)
+        for field in CATEGORICAL_FIELDS:
+            value = record.get(field, 0)
+            decoded[field] = self.values[field][value] if isinstance(value, int) else value
+        for field in LIST_FIELDS:
+            value = record.get(field, ())
+            decoded[field] = ', '.join(self.values[field][code] for code in value) if isinstance(value, tuple) else value
+        return decoded
+
+    @staticmethod
+    def normalize_record(record):
+        """Apply the list formatting that an encode/decode round trip produces"""
+        normalized = dict(record)
+        for field in LIST_FIELDS:
+            normalized[field] = ', '.join(split_list_value(record.get(field, '')))
+        return normalized
+
+
+class CorpusTable:
+    """Columnar, integer-coded view of a tag corpus for vectorized statistics
+
+    Categorical fields become code arrays. List fields become a code per
+    record into the distinct value combinations, each stored sparsely as flat
+    (combination, value code) arrays, so counts and pairs are computed once per
+    combination rather than once per record and memory stays linear in the
+    number of distinct values. Every field also gets a filled mask, which makes
+    distributions, co-occurrence and coverage a handful of NumPy operations.
+    """
+
+    def __init__(self, labels, codes, combination_codes, combination_items, filled, annotators):
+        self.labels = labels  # field -> values by code, code 0 is the empty value
+        self.codes = codes  # categorical field -> int32 code per record
+        self.combination_codes = combination_codes  # list field -> int32 combination per record
+        # list field -> (combination, value code) int64 arrays, sorted and unique per combination
+        self.combination_items = combination_items
+        self.filled = filled  # field -> bool mask of non-empty values
+        self.annotators = annotators  # pd.Categorical with one entry per record
+        self.size = len(annotators)
+
+    @classmethod
+    def from_frame(cls, df, vocabulary, annotator_column='annotator'):
+        """Build from a DataFrame of string tag columns such as a CSV export
+
+        Missing columns and values count as empty. Categorical columns are
+        used through their existing codes, which skips hashing every value.
+        """
+        df = df.rename(columns={'key_moments': 'moments'})
+        n = len(df)
+
+        def column(name):
+            # Zero-copy for object and pandas 3 "str" columns alike, and skips their NA scans
+            return np.asarray(df[name], dtype=object) if name in df else np.full(n, '', dtype=object)
+
+        def factorize(name, sort=False):
+            # Parse each distinct string once and broadcast the result back by code
+            if name in df and isinstance(df[name].dtype, pd.CategoricalDtype):
+                codes, uniques = df[name].cat.codes.to_numpy(), df[name].cat.categories
+            else:
+                codes, uniques = pd.factorize(column(name), sort=sort)
+            codes = codes.astype(np.int32)
+            uniques = list(uniques)
+            missing = codes < 0
+            if missing.any():
+                if '' not in uniques:
+                    uniques.append('')
+                codes[missing] = uniques.index('')
+            return codes, uniques
+
+        codes = {}
+        filled = {}
+        for field in CATEGORICAL_FIELDS:
+            row_codes, uniques = factorize(field)
+            mapping = np.array([vocabulary.encode(field, value.strip()) for value in uniques] or [0], dtype=np.int32)
+            codes[field] = mapping[row_codes]
+            filled[field] = codes[field] != 0
+        combination_codes = {}
+        combination_items = {}
+        for field in LIST_FIELDS:
+            row_codes, uniques = factorize(field)
+            # Split every distinct list at once and intern each distinct item once
+            items = pd.Series(uniques, dtype=object).str.split(',').explode().str.strip()
+            items = items[items.str.len() > 0]
+            item_codes, item_values = pd.factorize(np.asarray(items, dtype=object))
+            mapping = np.array([vocabulary.encode(field, value) for value in item_values] or [0], dtype=np.int64)
+            combinations, values = cls._sorted_unique_pairs(items.index.to_numpy(np.int64), mapping[item_codes])
+            combination_codes[field] = row_codes
+            combination_items[field] = (combinations, values)
+            has_items = np.zeros(max(len(uniques), 1), dtype=bool)
+            has_items[combinations] = True
+            filled[field] = has_items[row_codes]
+
+        def text_filled(field):
+            # Values are stripped when saved, so an empty string means unfilled; NaN != NaN
+            values = column(field)
+            return (values != '') & (values == values)
+
+        filled = {field: filled[field] if field in filled else text_filled(field) for field in TAG_FIELDS}
+        annotators = pd.Categorical.from_codes(*factorize(annotator_column, sort=True))
+        labels = {field: list(values) for field, values in vocabulary.values.items()}
+        return cls(labels, codes, combination_codes, combination_items, filled, annotators)
+
+    @staticmethod
+    def _sorted_unique_pairs(combinations, values):
+        """Sort (combination, value) pairs and drop repeats, such as an action listed twice"""
+        order = np.lexsort((values, combinations))
+        combinations, values = combinations[order], values[order]
+        keep = np.ones(len(values), dtype=bool)
+        keep[1:] = (combinations[1:] != combinations[:-1]) | (values[1:] != values[:-1])
+        return combinations[keep], values[keep]
+
+    def _item_weights(self, field):
+        """Value codes of every combination item, with the number of records using that combination"""
+        combinations, values = self.combination_items[field]
+        minlength = int(combinations.max()) + 1 if len(combinations) else 0
+        counts = np.bincount(self.combination_codes[field], minlength=minlength)
+        return combinations, values, counts[combinations]
+
+    def _value_counts(self, field):
+        width = len(self.labels[field])
+        if field in self.codes:
+            return np.bincount(self.codes[field], minlength=width)
+        _, values, weights = self._item_weights(field)
+        return np.bincount(values, weights=weights, minlength=width).astype(np.int64)
+
+    def distribution(self, field):
+        """Label counts for a field, most frequent first, excluding empty values"""
+        series = pd.Series(self._value_counts(field)[1:], index=self.labels[field][1:], name=field)
+        series = series[series > 0]
+        return series.sort_values(ascending=False, kind='stable')
+
+    def _pair_counts(self, field):
+        """Sparse co-occurrence of a list field: (first code, second code, records) arrays with first < second"""
+        combinations, values, weights = self._item_weights(field)
+        width = len(self.labels[field])
+        keys = []
+        key_weights = []
+        # Items are sorted within each combination, so pairing every item with the
+        # one d places later, while both belong to the same combination, finds
+        # each pair exactly once; lists are short, so this loop is too
+        for d in range(1, len(values)):
+            same = combinations[d:] == combinations[:-d]
+            if not same.any():
+                break
+            keys.append(values[:-d][same] * width + values[d:][same])
+            key_weights.append(weights[:-d][same])
+        if not keys:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        unique_keys, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate(key_weights)).astype(np.int64)
+        return unique_keys // width, unique_keys % width, counts
+
+    def pair_counts(self, field, top=None):
+        """Records sharing two values of a list field, most frequent pairs first"""
+        first, second, counts = self._pair_counts(field)
+        order = np.lexsort((first, second, -counts))[:top]
+        labels = self.labels[field]
+        index = pd.MultiIndex.from_arrays([[labels[code] for code in first[order]],
+                                           [labels[code] for code in second[order]]])
+        return pd.Series(counts[order], index=index, name=field)
+
+    def co_occurrence(self, field, top=50):
+        """Square matrix of how often two of the top most frequent values of a list field share a record
+
+        The diagonal holds each value's own count. Free-text lists can hold
+        any number of distinct values, so the matrix is limited to the top ones.
+        """
+        value_counts = self._value_counts(field)
+        value_counts[0] = 0
+        chosen = np.argsort(-value_counts, kind='stable')[:top]
+        chosen = chosen[value_counts[chosen] > 0]
+        position = np.full(len(value_counts), -1)
+        position[chosen] = np.arange(len(chosen))
+        first, second, counts = self._pair_counts(field)
+        first, second = position[first], position[second]
+        both = (first >= 0) & (second >= 0)
+        matrix = np.zeros((len(chosen), len(chosen)), dtype=np.int64)
+        matrix[first[both], second[both]] = counts[both]
+        matrix[second[both], first[both]] = counts[both]
+        matrix[np.arange(len(chosen)), np.arange(len(chosen))] = value_counts[chosen]
+        labels = [self.labels[field][code] for code in chosen]
+        return pd.DataFrame(matrix, index=labels, columns=labels)
+
+    def coverage(self):
+        """Fraction of records with each field filled in, per annotator"""
+        annotator_codes = self.annotators.codes
+        totals = np.bincount(annotator_codes, minlength=len(self.annotators.categories))
+        columns = {field: np.bincount(annotator_codes, weights=mask, minlength=len(totals)) / np.maximum(totals, 1)
+                   for field, mask in self.filled.items()}
+        coverage = pd.DataFrame(columns, index=self.annotators.categories)
+        coverage.insert(0, 'records', totals)
+        return coverage
+
+    def report(self, top=10):
+        """Plain-text summary of distributions, top co-occurring pairs and coverage"""
+        lines = [f"{self.size} records", ""]
+        for field in CATEGORICAL_FIELDS + LIST_FIELDS:
+            distribution = self.distribution(field)
+            lines.append(f"{field} ({len(distribution)} distinct)")
+            for label, count in distribution.head(top).items():
+                lines.append(f"  {label:28} {count:9d} {count / max(self.size, 1):7.1%}")
+            lines.append("")
+        for field in LIST_FIELDS:
+            lines.append(f"{field} co-occurrence")
+            for (first, second), count in self.pair_counts(field, top).items():
+                lines.append(f"  {first + ' + ' + second:40} {count:9d}")
+            lines.append("")
+        lines.append("Coverage by annotator")
+        lines.append(self.coverage().to_string(float_format=lambda value: f"{value:.0%}"))
+        return "\n".join(lines)
+
+
+class CorpusColumns:
+    """Integer-coded columns of VideoTagger.tags, kept up to date as records are saved
+
+    store() writes one record's codes into preallocated arrays, so taking a
+    CorpusTable of the whole corpus is a copy of a few arrays rather than a
+    pass over every record. List fields are interned into combinations of
+    value codes, the same way TagVocabulary interns single values.
+    """
+
+    def __init__(self, vocabulary, capacity=1024):
+        self.vocabulary = vocabulary
+        self.rows = {}  # tag key -> row
+        # Value code per row for categorical fields, combination code per row for list fields
+        self.codes = {field: np.zeros(capacity, np.int32) for field in CATEGORICAL_FIELDS + LIST_FIELDS}
+        self.filled = {field: np.zeros(capacity, bool) for field in TAG_FIELDS}
+        self.combination_codes = {field: {(): 0} for field in LIST_FIELDS}
+        # Flat (combination, value code) lists in CorpusTable.combination_items layout
+        self.combination_items = {field: ([], []) for field in LIST_FIELDS}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def store(self, key, record):
+        """Record the codes of an encoded tag record saved under key"""
+        if not isinstance(record, dict):
+            record = {'general_tags': record}
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = len(self.rows)
+            if row == len(self.filled['general_tags']):
+                self._grow()
+        for field in CATEGORICAL_FIELDS:
+            self.codes[field][row] = record.get(field) or 0
+        for field in LIST_FIELDS:
+            value = record.get(field) or ()
+            combination_codes = self.combination_codes[field]
+            code = combination_codes.get(value)
+            if code is None:
+                code = combination_codes[value] = len(combination_codes)
+                combinations, values = self.combination_items[field]
+                items = sorted(set(value))
+                combinations.extend([code] * len(items))
+                values.extend(items)
+            self.codes[field][row] = code
+        for field in TAG_FIELDS:
+            self.filled[field][row] = bool(record.get(field))
+
+    def _grow(self):
+        for columns in (self.codes, self.filled):
+            for field, column in columns.items():
+                grown = np.zeros(len(column) * 2, column.dtype)
+                grown[:len(column)] = column
+                columns[field] = grown
+
+    def table(self, annotator=''):
+        """Snapshot the columns as a CorpusTable that is safe to use from another thread"""
+        n = len(self.rows)
+        labels = {field: list(values) for field, values in self.vocabulary.values.items()}
+        combination_items = {}
+        for field, (combinations, values) in self.combination_items.items():
+            count = len(values)  # The lists only grow, and combinations is extended first
+            combination_items[field] = (np.array(combinations[:count], dtype=np.int64),
+                                        np.array(values[:count], dtype=np.int64))
+        return CorpusTable(
+            labels,
+            {field: self.codes[field][:n].copy() for field in CATEGORICAL_FIELDS},
+            {field: self.codes[field][:n].copy() for field in LIST_FIELDS},
+            combination_items,
+            {field: mask[:n].copy() for field, mask in self.filled.items()},
+            pd.Categorical.from_codes(np.zeros(n, np.int8), categories=[annotator]),
+        )
+
+
+class ThumbnailCache:
+    """Thread-safe LRU cache of decoded thumbnail frames keyed by video path"""
+
+    def __init__(self, decode, max_entries=200, workers=2):
+        self.decode = decode
+        self.max_entries = max_entries
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbnail")
+
+    def get(self, video_path):
+        with self._lock:
+            frame = self._frames.get(video_path)
+            if frame is not None:
+                self._frames.move_to_end(video_path)
+            return frame
+
+    def put(self, video_path, frame):
+        with self._lock:
+            self._frames[video_path] = frame
+            self._frames.move_to_end(video_path)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+
+    def discard(self, video_path):
+        with self._lock:
+            self._frames.pop(video_path, None)
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+    def rename(self, old_path, new_path):
+        with self._lock:
+            frame = self._frames.pop(old_path, None)
+            if frame is not None:
+                self._frames[new_path] = frame
+
+    def prefetch(self, video_paths):
+        """Decode thumbnails for video_paths on background threads"""
+        for video_path in video_paths:
+            self._executor.submit(self._prefetch_one, video_path)
+
+    def _prefetch_one(self, video_path):
+        with self._lock:
+            if video_path in self._frames:
+                return
+        try:
+            frame = self.decode(video_path)
+        except Exception as e:
+            print(f"Error prefetching thumbnail for {video_path}: {e}")
+            return
+        if frame is not None:
+            self.put(video_path, frame)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ReadAheadCache:
+    """Size-bounded LRU of local copies of (usually network-mounted) videos
+
+    Upcoming videos are copied on background threads with large sequential
+    reads, so seek-heavy playback and thumbnailing hit local disk instead of
+    NFS/SMB. Each instance copies into its own private directory under
+    cache_root, created on the first prefetch, and only ever deletes the files
+    it wrote there. The clip being played and the clips queued behind it are
+    pinned, so a finishing copy only ever evicts older entries.
+    """
+
+    CHUNK_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, cache_dir=None, max_bytes=20 * 1024 ** 3, workers=2):
+        self.cache_root = cache_dir or os.environ.get('VIDEO_TAGGER_CACHE_DIR', tempfile.gettempdir())
+        self.cache_dir = None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_copied = 0
+        self._entries = OrderedDict()  # source path -> (local path, size, mtime_ns)
+        self._in_flight = set()
+        self._pinned = set()  # Current and queued source paths, never evicted
+        self._total_bytes = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="readahead")
+
+    def local_path(self, video_path):
+        """Return the local copy of video_path if it is cached and current, else None"""
+        with self._lock:
+            entry = self._entries.get(video_path)
+        if entry is not None:
+            local_path, size, mtime_ns = entry
+            try:
+                st = os.stat(video_path)
+            except OSError:
+                st = None
+            if (st is not None and (st.st_size, st.st_mtime_ns) == (size, mtime_ns)
+                    and os.path.exists(local_path)):
+                with self._lock:
+                    if video_path in self._entries:
+                        self._entries.move_to_end(video_path)
+                    self.hits += 1
+                return local_path
+            # The source changed since it was copied, or the copy was removed
+            self.discard(video_path)
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def prefetch(self, video_paths, current=None):
+        """Copy video_paths, in priority order, into the cache on background threads
+
+        Paths are taken in order until the current clip plus the queued ones
+        would no longer fit in max_bytes; those are pinned and the rest skipped.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if self.cache_dir is None:
+                try:
+                    os.makedirs(self.cache_root, exist_ok=True)
+                    self.cache_dir = tempfile.mkdtemp(prefix='video_tagger_cache_', dir=self.cache_root)
+                except OSError as e:
+                    print(f"Cannot create read-ahead cache in {self.cache_root}: {e}")
+                    return
+            entry = self._entries.get(current)
+            budget = self.max_bytes - (entry[1] if entry else 0)
+        
+        queued = []
+        for video_path in video_paths:
+            try:
+                size = os.stat(video_path).st_size
+            except OSError:
+                continue
+            if size > budget:
+                break
+            budget -= size
+            queued.append(video_path)
+        with self._lock:
+            self._pinned = {current, *queued}
+        
+        for video_path in queued:
+            with self._lock:
+                if video_path in self._entries or video_path in self._in_flight:
+                    continue
+                self._in_flight.add(video_path)
+            self._executor.submit(self._copy_one, video_path)
+
+    def _copy_one(self, video_path):
+        digest = hashlib.sha1(video_path.encode('utf-8')).hexdigest()
+        local_path = os.path.join(self.cache_dir, digest + os.path.splitext(video_path)[1])
+        partial_path = local_path + '.part'
+        try:
+            st = os.stat(video_path)
+            if st.st_size > self.max_bytes:
+                return
+            with open(video_path, 'rb', buffering=0) as src, open(partial_path, 'wb') as dst:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                buffer = bytearray(self.CHUNK_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    n = src.readinto(buffer)
+                    if not n:
+                        break
+                    dst.write(view[:n])
+            os.replace(partial_path, local_path)
+        except OSError as e:
+            print(f"Error caching {video_path}: {e}")
+            self._remove_files([partial_path])
+            return
+        finally:
+            with self._lock:
+                self._in_flight.discard(video_path)
+        
+        with self._lock:
+            if self._closed:
+                # Finished after shutdown() already cleaned up
+                evicted = [local_path]
+            else:
+                self._entries[video_path] = (local_path, st.st_size, st.st_mtime_ns)
+                self._total_bytes += st.st_size
+                self.bytes_copied += st.st_size
+                evicted = []
+                for old_path in list(self._entries):
+                    if self._total_bytes <= self.max_bytes:
+                        break
+                    if old_path in self._pinned:
+                        continue
+                    old_local, old_size, _ = self._entries.pop(old_path)
+                    self._total_bytes -= old_size
+                    evicted.append(old_local)
+        self._remove_files(evicted)
+
+    def discard(self, video_path):
+        with self._lock:
+            entry = self._entries.pop(video_path, None)
+            if entry is not None:
+                self._total_bytes -= entry[1]
+        if entry is not None:
+            self._remove_files([entry[0]])
+
+    def _remove_files(self, local_paths):
+        """Delete copies this instance wrote, and its directory once that is empty"""
+        for local_path in local_paths:
+            try:
+                os.remove(local_path)
+            except OSError:
+                pass
+        if self._closed and self.cache_dir:
+            try:
+                os.rmdir(self.cache_dir)
+            except OSError:
+                pass  # A copy is still in flight and will retry when it finishes
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'cached_bytes': self._total_bytes,
+                'bytes_copied': self.bytes_copied,
+            }
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            local_paths = [entry[0] for entry in self._entries.values()]
+            self._entries.clear()
+            self._total_bytes = 0
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._remove_files(local_paths)
+
+
+class FrameRingBuffer:
+    """Bounded ring of decoded, downscaled frames around the playhead
+
+    A decoder thread reads sequentially from a single seek point and keeps the
+    ring filled ahead of the cursor, so stepping a frame forward or back within
+    the buffered window never re-seeks. Stepping back past the oldest buffered
+    frame refills the window around the cursor.
+    """
+
+    def __init__(self, video_path, capacity=120, size=THUMBNAIL_SIZE):
+        self.video_path = video_path
+        self.capacity = capacity
+        self.lookback = capacity // 4  # Frames kept behind the cursor when moving forward
+        self.size = size
+        self.fps = 0.0
+        self.frame_count = 0
+        self._frames = deque(maxlen=capacity)  # (timestamp ms, RGB frame) for consecutive frames
+        self._first_index = 0
+        self._cursor = 0
+        self._fill_until = 0
+        self._seek_index = None
+        self._eof = False
+        self._stopped = False
+        self._cond = threading.Condition()
+
+    def start(self, position_ms):
+        """Open the video and start decoding around position_ms; False if it cannot be opened"""
+        cap = cv2.VideoCapture(self.video_path)
+        if not cap.isOpened():
+            return False
+        # Some containers report 0 or NaN for either; NaN would break the index arithmetic
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        self.fps = fps if math.isfinite(fps) and fps > 0 else 25.0
+        frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+        self.frame_count = int(frame_count) if math.isfinite(frame_count) and frame_count > 0 else 0
+        self._cursor = self._clamp(int(round(position_ms * self.fps / 1000)))
+        self._seek_index = max(0, self._cursor - self.lookback)
+        self._fill_until = self._cursor + self.capacity - self.lookback
+        threading.Thread(target=self._decode_loop, args=(cap,), name="frame-ring", daemon=True).start()
+        return True
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def step(self, delta):
+        """Move the cursor by delta frames"""
+        with self._cond:
+            self._move_to(self._cursor + delta)
+
+    def seek(self, position_ms):
+        """Move the cursor to the frame at position_ms"""
+        with self._cond:
+            self._move_to(int(round(position_ms * self.fps / 1000)))
+
+    def current(self):
+        """Return (frame index, timestamp ms, RGB frame) at the cursor, or None if not decoded yet"""
+        with self._cond:
+            offset = self._cursor - self._first_index
+            if self._seek_index is None and 0 <= offset < len(self._frames):
+                timestamp_ms, frame = self._frames[offset]
+                return self._cursor, timestamp_ms, frame
+            return None
+
+    def position_ms(self):
+        current = self.current()
+        if current is not None:
+            return current[1]
+        return self._cursor * 1000 / self.fps
+
+    def exhausted(self):
+        """True when the decoder has nothing more to produce for the cursor"""
+        with self._cond:
+            return self._stopped or (self._eof and self._cursor >= self._first_index + len(self._frames))
+
+    def _clamp(self, index):
+        index = max(0, index)
+        if self.frame_count > 0:
+            index = min(index, self.frame_count - 1)
+        return index
+
+    def _move_to(self, index):
+        index = self._clamp(index)
+        last_index = self._first_index + len(self._frames) - 1
+        if self._eof and index > last_index >= 0:
+            # Container frame counts are estimates; stop at the last real frame
+            index = last_index
+        if index > self._cursor:
+            self._fill_until = max(self._fill_until, index + self.capacity - self.lookback)
+        if index < self._first_index or index > last_index + self.capacity:
+            # Outside the window: refill it with the cursor near its far end
+            self._seek_index = max(0, index - self.capacity + self.lookback + 1) if index < self._cursor else max(0, index - self.lookback)
+            self._fill_until = index + (self.lookback if index < self._cursor else self.capacity - self.lookback)
+        self._cursor = index
+        self._cond.notify_all()
+
+    def _decode_loop(self, cap):
+        try:
+            while True:
+                with self._cond:
+                    while not self._stopped and self._seek_index is None and (
+                            self._eof or self._first_index + len(self._frames) > self._fill_until):
+                        self._cond.wait()
+                    if self._stopped:
+                        return
+                    seek_index = self._seek_index
+                    if seek_index is not None:
+                        self._seek_index = None
+                        self._frames.clear()
+                        self._first_index = seek_index
+                        self._eof = False
+                if seek_index is not None:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, seek_index)
+                
+                # Decode outside the lock so stepping stays responsive
+                ret, frame = cap.read()
+                timestamp_ms = cap.get(cv2.CAP_PROP_POS_MSEC) if ret else 0.0
+                if ret:
+                    frame = downscale_frame(frame, self.size)
+                with self._cond:
+                    if self._seek_index is not None:
+                        continue  # Decoded for a window that was just abandoned
+                    if not ret:
+                        self._eof = True
+                    else:
+                        if len(self._frames) == self.capacity:
+                            self._first_index += 1
+                        self._frames.append((timestamp_ms, frame))
+                    self._cond.notify_all()
+        finally:
+            cap.release()
+
+
+class LatencyHistogram:
+    """Fixed-size latency histogram with log-spaced millisecond buckets"""
+
+    BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms):
+        self.counts[bisect.bisect_left(self.BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS_MS, self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'sum_ms': self.total_ms,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': self.max_ms,
+            'buckets': dict(zip([*map(str, self.BUCKET_BOUNDS_MS), '+Inf'], self.counts)),
+        }
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Timer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.record((time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class Metrics:
+    """Latency histograms for the hot paths; timing is a no-op while disabled"""
+
+    _NULL_TIMER = _NullTimer()
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.histograms = {}
+        self._started = {}
+
+    def _histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        return histogram
+
+    def time(self, name):
+        """Context manager recording the duration of its block under name"""
+        if not self.enabled:
+            return self._NULL_TIMER
+        return _Timer(self._histogram(name))
+
+    def start(self, name):
+        """Start a span that is finished later from another callback"""
+        if self.enabled:
+            self._started[name] = time.perf_counter()
+
+    def finish(self, name):
+        started = self._started.pop(name, None)
+        if started is not None:
+            self._histogram(name).record((time.perf_counter() - started) * 1000)
+
+    def snapshot(self):
+        return {name: histogram.snapshot() for name, histogram in sorted(self.histograms.items())}
+
+    def summary_text(self):
+        lines = [f"{'metric':18} {'n':>6} {'p50':>8} {'p95':>8} {'max':>8}"]
+        for name, stats in self.snapshot().items():
+            lines.append(f"{name:18} {stats['count']:6d} {stats['p50_ms']:7.1f}ms "
+                         f"{stats['p95_ms']:6.1f}ms {stats['max_ms']:6.1f}ms")
+        return "\n".join(lines)
+
+    def write(self, path):
+        """Append a JSON line snapshot to *.jsonl paths, otherwise write Prometheus text format"""
+        if path.endswith('.jsonl'):
+            with open(path, 'a') as f:
+                f.write(json.dumps({'timestamp': time.time(), 'metrics': self.snapshot()}) + "\n")
+            return
+        
+        lines = []
+        for name, histogram in sorted(self.histograms.items()):
+            metric = f"video_tagger_{name}_seconds"
+            lines.append(f"# HELP {metric} Latency of {name.replace('_', ' ')}")
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.BUCKET_BOUNDS_MS, histogram.counts):
+                cumulative += bucket_count
+                lines.append(f'{metric}_bucket{{le="{bound / 1000:g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum {histogram.total_ms / 1000:.6f}")
+            lines.append(f"{metric}_count {histogram.count}")
+        # Write then rename so scrapers never read a half-written file
+        with open(path + '.tmp', 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(path + '.tmp', path)
+
 
 class VideoTagger(QMainWindow):
     def __init__(self):
@@ -24,61 +1140,46 @@ class VideoTagger(QMainWindow):
         # Initialize variables
         self.video_files = []
         self.current_index = 0
-        self.tags = {}
+        self.tags = {}  # content fingerprint -> tag record
+        self.tag_paths = {}  # content fingerprint -> last known video path
+        self.fingerprints = FingerprintIndex()
+        self.relink_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="relink")
+        self.current_tag_key = None
+        self.vocabulary = TagVocabulary()
+        self.corpus = CorpusColumns(self.vocabulary)  # Statistics columns mirroring self.tags
+        self.stats_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="corpus_stats")
+        self.stats_future = None
         self.is_playing = False
         self.thumbnail_label = None
+        self.video_directory = None
+        self.directory_snapshot = {}  # path -> (inode, size, mtime_ns) from the last directory scan
+        self.watch_dir_mtime = None
+        self.poster_frames = PosterFrameSelector()
+        self.thumbnail_cache = ThumbnailCache(self.decode_poster_frame)
+        self.readahead_cache = ReadAheadCache()
+        self.readahead_count = 3  # Number of upcoming videos to copy locally
+        self.current_media_path = (None, None)  # (video path, path actually opened)
+        self.frame_buffer = None  # FrameRingBuffer while in frame-step mode
+        
+        # Hot-path instrumentation: VIDEO_TAGGER_METRICS=<file.prom|file.jsonl> enables
+        # periodic dumps, VIDEO_TAGGER_PROFILE=<file.pstats> profiles the whole session
+        self.metrics_path = os.environ.get('VIDEO_TAGGER_METRICS')
+        self.metrics = Metrics(enabled=bool(self.metrics_path))
+        self.profile_path = os.environ.get('VIDEO_TAGGER_PROFILE')
+        self.profiler = None
+        if self.profile_path:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
         
         # Predefined tagging options
-        self.location_classes = [
-            "Indoor", "Outdoor", "Office", "Home", "Street", "Park", "Restaurant", 
-            "Gym", "Studio", "Classroom", "Conference Room", "Kitchen", "Bedroom",
-            "Bathroom", "Garage", "Garden", "Beach", "Mountain", "Forest", "Urban",
-            "Rural", "Suburban", "Industrial", "Commercial", "Residential"
-        ]
-        
-        self.action_types = [
-            "Walking", "Running", "Sitting", "Standing", "Talking", "Listening",
-            "Cooking", "Eating", "Drinking", "Working", "Reading", "Writing",
-            "Typing", "Exercising", "Dancing", "Singing", "Playing", "Teaching",
-            "Learning", "Presenting", "Meeting", "Shopping", "Cleaning", "Driving",
-            "Cycling", "Swimming", "Lifting", "Carrying", "Opening", "Closing"
-        ]
-        
-        self.movement_types = [
-            "Static", "Pan Left", "Pan Right", "Tilt Up", "Tilt Down", "Tilt Left", "Tilt Right", "Zoom In",
-            "Zoom Out", "Dolly In", "Dolly Out", "Tracking Left", "Tracking Right", "Crane Up", "Crane Down", 
-            "Handheld", "Steadicam", "Drone", "Aerial", "Other"
-        ]
-        
-        self.shot_types = [
-            "Extreme Long Shot", "Long Shot", "Full Shot", "Medium Long Shot",
-            "Medium Shot", "Medium Close-Up", "Close-Up", "Extreme Close-Up",
-            "Two Shot", "Three Shot", "Group Shot", "Over-the-Shoulder",
-            "Point of View", "Low Angle", "High Angle", "Eye Level", "Bird's Eye",
-            "Worm's Eye", "Dutch Angle", "Profile Shot", "Frontal Shot"
-        ]
-        
-        # Content movement types
-        self.content_movement_types = [
-            "High", "Medium", "Low", "No movement"
-        ]
-        
-        # Handheld camera options
-        self.handheld_options = [
-            "Yes", "No", "Partially", "Uncertain"
-        ]
-        
-        # Depth of field options
-        self.depth_of_field_options = [
-            "Shallow", "Medium", "Deep", "Very Deep", "Variable", "Uncertain"
-        ]
-        
-        # Color scale options
-        self.color_scale_options = [
-            "Color", "Black & White", "Sepia", "Monochrome", "High Contrast", 
-            "Low Saturation", "High Saturation", "Warm Tone", "Cool Tone", 
-            "Neutral", "Vintage", "Cinematic", "Other"
-        ]
+        self.location_classes = list(LOCATION_CLASSES)
+        self.action_types = list(ACTION_TYPES)
+        self.movement_types = list(MOVEMENT_TYPES)
+        self.shot_types = list(SHOT_TYPES)
+        self.content_movement_types = list(CONTENT_MOVEMENT_TYPES)
+        self.handheld_options = list(HANDHELD_OPTIONS)
+        self.depth_of_field_options = list(DEPTH_OF_FIELD_OPTIONS)
+        self.color_scale_options = list(COLOR_SCALE_OPTIONS)
         
         # Create main widget and layout
         main_widget = QWidget()
@@ -126,6 +1227,30 @@ class VideoTagger(QMainWindow):
         controls_layout.addWidget(self.next_button)
         left_layout.addLayout(controls_layout)
         
+        # Frame stepping controls
+        frame_step_layout = QHBoxLayout()
+        self.frame_back_button = QPushButton("◀ Frame")
+        self.frame_back_button.setShortcut("Alt+Left")
+        self.frame_step_button = QPushButton("Frame Step")
+        self.frame_step_button.setCheckable(True)
+        self.frame_step_button.setToolTip("Pause and step through decoded frames (Alt+Left / Alt+Right)")
+        self.frame_forward_button = QPushButton("Frame ▶")
+        self.frame_forward_button.setShortcut("Alt+Right")
+        self.frame_position_label = QLabel("")
+        self.frame_position_label.setStyleSheet("QLabel { color: #757575; font-size: 10px; }")
+        frame_step_layout.addWidget(self.frame_back_button)
+        frame_step_layout.addWidget(self.frame_step_button)
+        frame_step_layout.addWidget(self.frame_forward_button)
+        frame_step_layout.addWidget(self.frame_position_label)
+        left_layout.addLayout(frame_step_layout)
+        
+        # Latency stats overlay (toggled with F12)
+        self.stats_overlay = QLabel(left_panel)
+        self.stats_overlay.setStyleSheet("QLabel { background-color: rgba(0, 0, 0, 180); color: #00E676; font-family: monospace; font-size: 10px; padding: 6px; }")
+        self.stats_overlay.hide()
+        self.stats_shortcut = QShortcut(QKeySequence("F12"), self)
+        self.stats_shortcut.activated.connect(self.toggle_stats_overlay)
+        
         # Progress slider
         self.progress_slider = QSlider(Qt.Orientation.Horizontal)
         self.progress_slider.sliderMoved.connect(self.set_position)
@@ -149,6 +1274,38 @@ class VideoTagger(QMainWindow):
         self.select_dir_button.setStyleSheet("QPushButton { padding: 8px; font-weight: bold; }")
         right_layout.addWidget(self.select_dir_button)
         
+        # Contact sheet for bulk tagging
+        self.contact_sheet_button = QPushButton("Contact Sheet (Bulk Tag)")
+        self.contact_sheet_button.setStyleSheet("QPushButton { padding: 5px; }")
+        right_layout.addWidget(self.contact_sheet_button)
+        self.contact_sheet = None
+        
+        self.stats_button = QPushButton("Corpus Statistics")
+        self.stats_button.setStyleSheet("QPushButton { padding: 5px; }")
+        right_layout.addWidget(self.stats_button)
+        
+        # Watch folder options
+        watch_layout = QHBoxLayout()
+        self.watch_checkbox = QCheckBox("Watch folder for new videos")
+        self.watch_checkbox.setToolTip("Append videos as they arrive without rescanning or losing your place")
+        self.prefetch_checkbox = QCheckBox("Prefetch thumbnails")
+        self.prefetch_checkbox.setToolTip("Decode thumbnails of newly arrived videos in the background")
+        self.prefetch_checkbox.setChecked(True)
+        watch_layout.addWidget(self.watch_checkbox)
+        watch_layout.addWidget(self.prefetch_checkbox)
+        right_layout.addLayout(watch_layout)
+        
+        # Local read-ahead cache for videos on network storage
+        cache_layout = QHBoxLayout()
+        self.readahead_checkbox = QCheckBox("Local read-ahead cache")
+        self.readahead_checkbox.setToolTip(f"Copy the next {self.readahead_count} videos to a private folder under {self.readahead_cache.cache_root} in the background")
+        self.cache_stats_label = QLabel("")
+        self.cache_stats_label.setStyleSheet("QLabel { color: #757575; font-size: 10px; }")
+        cache_layout.addWidget(self.readahead_checkbox)
+        cache_layout.addWidget(self.cache_stats_label)
+        cache_layout.addStretch()
+        right_layout.addLayout(cache_layout)
+        
         # File info
         self.file_info = QLabel("No file selected")
         self.file_info.setStyleSheet("QLabel { padding: 5px; background-color: #f0f0f0; border-radius: 3px; }")
@@ -379,9 +1536,16 @@ class VideoTagger(QMainWindow):
         self.prev_button.clicked.connect(self.previous_video)
         self.next_button.clicked.connect(self.next_video)
         self.play_button.clicked.connect(self.toggle_play)
+        self.frame_step_button.toggled.connect(self.toggle_frame_step)
+        self.frame_back_button.clicked.connect(lambda: self.step_frame(-1))
+        self.frame_forward_button.clicked.connect(lambda: self.step_frame(1))
         self.save_button.clicked.connect(self.save_tags)
         self.export_button.clicked.connect(self.export_to_csv)
         self.select_dir_button.clicked.connect(self.select_directory)
+        self.contact_sheet_button.clicked.connect(self.show_contact_sheet)
+        self.stats_button.clicked.connect(self.show_corpus_stats)
+        self.watch_checkbox.toggled.connect(self.toggle_watch_mode)
+        self.readahead_checkbox.toggled.connect(self.toggle_readahead)
         
         # Connect action checkboxes
         for checkbox in self.action_checkboxes.values():
@@ -407,16 +1571,42 @@ class VideoTagger(QMainWindow):
         self.timer.setInterval(1000)  # Update every second
         self.timer.timeout.connect(self.update_progress)
         
+        # Directory watching: QFileSystemWatcher is backed by inotify on Linux
+        # (FSEvents/kqueue elsewhere); when it cannot watch the path we fall back
+        # to polling the directory mtime, which only changes on add/remove/rename
+        self.dir_watcher = QFileSystemWatcher()
+        self.dir_watcher.directoryChanged.connect(self.on_watched_directory_changed)
+        self.watch_poll_timer = QTimer()
+        self.watch_poll_timer.setInterval(2000)
+        self.watch_poll_timer.timeout.connect(self.poll_watched_directory)
+        # Copying a clip in fires a burst of change events, so coalesce them
+        self.watch_debounce_timer = QTimer()
+        self.watch_debounce_timer.setSingleShot(True)
+        self.watch_debounce_timer.setInterval(500)
+        self.watch_debounce_timer.timeout.connect(self.sync_video_files)
+        
+        # Stats overlay refresh and periodic metrics dump
+        self.stats_timer = QTimer()
+        self.stats_timer.setInterval(1000)
+        self.stats_timer.timeout.connect(self.refresh_stats_overlay)
+        self.metrics_timer = QTimer()
+        self.metrics_timer.setInterval(30000)
+        self.metrics_timer.timeout.connect(self.dump_metrics)
+        if self.metrics_path:
+            self.metrics_timer.start()
+        
         # Initialize UI
         self.update_ui()
     
     def select_directory(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Video Directory")
         if directory:
-            self.video_files = []
-            for file in os.listdir(directory):
-                if file.lower().endswith(('.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv')):
-                    self.video_files.append(os.path.join(directory, file))
+            self.stop_watching()
+            self.video_directory = directory
+            self.directory_snapshot = scan_video_directory(directory)
+            self.video_files = list(self.directory_snapshot)
+            if self.watch_checkbox.isChecked():
+                self.start_watching()
             
             if not self.video_files:
                 QMessageBox.warning(self, "No Videos", "No video files found in the selected directory!\n\nSupported formats: .mp4, .mov, .avi, .mkv, .wmv, .flv")
@@ -424,33 +1614,174 @@ class VideoTagger(QMainWindow):
                 self.update_ui()
                 return
             
+            self.relink_tags(self.video_files)
             self.current_index = 0
             self.progress_bar.setMaximum(len(self.video_files))
             self.load_current_video()
             self.update_ui()
     
+    def toggle_watch_mode(self, checked):
+        if checked:
+            self.start_watching()
+        else:
+            self.stop_watching()
+    
+    def start_watching(self):
+        """Start watching the current video directory for added, removed or renamed files"""
+        self.stop_watching()
+        if not self.video_directory:
+            return
+        
+        if not self.dir_watcher.addPath(self.video_directory):
+            print(f"File system events unavailable for {self.video_directory}, polling only")
+        # addPath also succeeds on NFS/SMB mounts, where changes made by other
+        # machines never raise an event, so the cheap mtime poll always runs
+        self.watch_dir_mtime = self._watched_directory_mtime()
+        self.watch_poll_timer.start()
+        
+        # Pick up anything that arrived since the last scan
+        self.sync_video_files()
+    
+    def stop_watching(self):
+        directories = self.dir_watcher.directories()
+        if directories:
+            self.dir_watcher.removePaths(directories)
+        self.watch_poll_timer.stop()
+        self.watch_debounce_timer.stop()
+    
+    def on_watched_directory_changed(self, path):
+        self.watch_debounce_timer.start()
+    
+    def _watched_directory_mtime(self):
+        try:
+            return os.stat(self.video_directory).st_mtime_ns
+        except OSError:
+            return None
+    
+    def poll_watched_directory(self):
+        """Rescan only when the directory mtime moved since the last poll"""
+        mtime = self._watched_directory_mtime()
+        if mtime != self.watch_dir_mtime:
+            self.sync_video_files()
+    
+    def sync_video_files(self):
+        """Merge the watched directory's contents into video_files, keeping the current position"""
+        if not self.video_directory:
+            return
+        
+        # Taken before the scan so the poll neither repeats an event-driven sync
+        # nor misses a change that lands while the scan is running
+        self.watch_dir_mtime = self._watched_directory_mtime()
+        try:
+            snapshot = scan_video_directory(self.video_directory)
+        except OSError as e:
+            print(f"Error scanning {self.video_directory}: {e}")
+            return
+        
+        previous = self.directory_snapshot
+        # Always keep the latest sizes and mtimes, or a clip still being copied
+        # when it was first seen would never match itself after a rename
+        self.directory_snapshot = snapshot
+        removed = [path for path in previous if path not in snapshot]
+        added = [path for path in snapshot if path not in previous]
+        if not removed and not added:
+            return
+        
+        # A removed path whose inode, size and mtime all reappear under a new
+        # name is a rename; anything less is a delete plus an unrelated add
+        added_by_identity = {snapshot[path]: path for path in added}
+        renamed = {}
+        for old_path in removed:
+            new_path = added_by_identity.get(previous[old_path])
+            if new_path is not None:
+                renamed[old_path] = new_path
+        deleted = set(removed) - renamed.keys()
+        new_files = sorted(set(added) - set(renamed.values()))
+        
+        current_file = self.video_files[self.current_index] if self.video_files else None
+        if current_file in deleted:
+            # Keep whatever was typed for a clip that disappeared underneath us
+            self.auto_save_current_tags()
+        
+        files = []
+        for path in self.video_files:
+            if path in renamed:
+                new_path = renamed[path]
+                self.thumbnail_cache.rename(path, new_path)
+                self.readahead_cache.discard(path)
+                files.append(new_path)
+            elif path in deleted:
+                # Tags are kept so the annotation survives if the file comes back
+                self.thumbnail_cache.discard(path)
+                self.readahead_cache.discard(path)
+            else:
+                files.append(path)
+        files.extend(new_files)
+        self.video_files = files
+        self.relink_tags(new_files + list(renamed.values()))
+        self.progress_bar.setMaximum(len(files))
+        
+        current_file = renamed.get(current_file, current_file)
+        if current_file in files:
+            self.current_index = files.index(current_file)
+            self.update_file_info()
+            self.progress_bar.setValue(self.current_index + 1)
+        elif files:
+            self.current_index = min(self.current_index, len(files) - 1)
+            self.load_current_video()
+        else:
+            self.current_index = 0
+            self.media_player.stop()
+            self.clear_structured_tags()
+            self.file_info.setText("No video files found in selected directory")
+        
+        if new_files and self.prefetch_checkbox.isChecked():
+            self.thumbnail_cache.prefetch(new_files)
+        
+        changes = []
+        if new_files:
+            changes.append(f"{len(new_files)} added")
+        if renamed:
+            changes.append(f"{len(renamed)} renamed")
+        if deleted:
+            changes.append(f"{len(deleted)} removed")
+        self.status_label.setText(f"↻ Folder updated: {', '.join(changes)}")
+        self.status_label.setStyleSheet("QLabel { padding: 3px; color: #2196F3; font-size: 10px; }")
+        QTimer.singleShot(3000, lambda: self.status_label.setText(""))
+        print(f"Watched folder updated: {', '.join(changes)}")
+        
+        self.update_ui()
+    
     def load_current_video(self):
         if not self.video_files:
             return
             
         # Stop current playback
+        self.exit_frame_step(seek=False)
         self.media_player.stop()
         self.timer.stop()
         
+        # Serve playback and thumbnailing from the local copy when cached
+        video_path = self.video_files[self.current_index]
+        self.current_media_path = (video_path, self.resolve_video_path(video_path))
+        
         # Show thumbnail first
         self.show_thumbnail()
         
         # Load new video
-        video_path = self.video_files[self.current_index]
-        self.media_player.setSource(QUrl.fromLocalFile(video_path))
+        self.metrics.start('media_load')
+        self.media_player.setSource(QUrl.fromLocalFile(self.current_media_path[1]))
+        self.schedule_readahead()
         
         self.update_file_info()
         self.progress_bar.setValue(self.current_index + 1)
         
         # Load existing tags if any
-        if self.video_files[self.current_index] in self.tags:
-            tag_data = self.tags[self.video_files[self.current_index]]
+        self.current_tag_key = self.tag_key(video_path)
+        if self.current_tag_key in self.tags:
+            tag_data = self.tags[self.current_tag_key]
             if isinstance(tag_data, dict):
+                tag_data = self.vocabulary.decode_record(tag_data)
                 # Load structured tags
                 self.people_input.setText(tag_data.get('people', ''))
                 self.moments_input.setText(tag_data.get('moments', ''))
@@ -488,6 +1819,81 @@ class VideoTagger(QMainWindow):
         else:
             self.clear_structured_tags()
     
+    def tag_key(self, video_path):
+        """Key tags by content fingerprint so they survive moves, renames and remounts"""
+        try:
+            return self.fingerprints.fingerprint(video_path)
+        except OSError as e:
+            print(f"Error fingerprinting {video_path}, keying tags by path: {e}")
+            return video_path
+    
+    def relink_tags(self, video_paths):
+        """Reattach existing tag records to video_paths whose content they were saved for
+
+        Fingerprinting a whole directory can take a while on network mounts, so
+        it runs in the background and the new paths are applied when it is done.
+        The current video does not wait for it: load_current_video keys its
+        tags with tag_key directly.
+        """
+        if not self.tags or not video_paths:
+            return
+        future = self.relink_executor.submit(self.fingerprints.fingerprint_many, list(video_paths))
+        self.poll_relink_tags(future)
+    
+    def poll_relink_tags(self, future):
+        if not future.done():
+            QTimer.singleShot(100, lambda: self.poll_relink_tags(future))
+            return
+        try:
+            fingerprints = future.result()
+        except Exception as e:
+            print(f"Error relinking tags: {e}")
+            return
+        
+        # The directory may have changed while the fingerprints were computed
+        current_files = set(self.video_files)
+        relinked = 0
+        for video_path, fingerprint in fingerprints.items():
+            if (video_path in current_files and fingerprint in self.tags
+                    and self.tag_paths.get(fingerprint) != video_path):
+                self.tag_paths[fingerprint] = video_path
+                relinked += 1
+        if relinked:
+            self.status_label.setText(f"↻ Relinked tags for {relinked} moved video(s)")
+            self.status_label.setStyleSheet("QLabel { padding: 3px; color: #2196F3; font-size: 10px; }")
+            QTimer.singleShot(3000, lambda: self.status_label.setText(""))
+            print(f"Relinked tags for {relinked} moved video(s)")
+    
+    def resolve_video_path(self, video_path):
+        """Return the local cached copy of video_path when read-ahead has one"""
+        if self.readahead_checkbox.isChecked():
+            local_path = self.readahead_cache.local_path(video_path)
+            self.update_cache_stats()
+            if local_path:
+                return local_path
+        return video_path
+    
+    def schedule_readahead(self):
+        """Start copying the next few videos in the queue to the local cache"""
+        if not self.readahead_checkbox.isChecked() or not self.video_files:
+            return
+        upcoming = self.video_files[self.current_index + 1:self.current_index + 1 + self.readahead_count]
+        self.readahead_cache.prefetch(upcoming, current=self.video_files[self.current_index])
+    
+    def toggle_readahead(self, checked):
+        if checked:
+            self.schedule_readahead()
+        self.update_cache_stats()
+    
+    def update_cache_stats(self):
+        if not self.readahead_checkbox.isChecked():
+            self.cache_stats_label.setText("")
+            return
+        stats = self.readahead_cache.stats()
+        self.cache_stats_label.setText(
+            f"{stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%}), "
+            f"{stats['entries']} cached, {stats['cached_bytes'] / 1024 ** 3:.1f} GB")
+    
     def clear_structured_tags(self):
         """Clear all structured tag inputs"""
         self.people_input.clear()
@@ -510,7 +1916,7 @@ class VideoTagger(QMainWindow):
         self.color_combo.setCurrentText('')
         self.color_description.clear()
         self.color_description.setVisible(False)
-            self.tag_input.clear()
+        self.tag_input.clear()
         
         # Clear checkboxes
         for checkbox in self.action_checkboxes.values():
@@ -532,21 +1938,28 @@ class VideoTagger(QMainWindow):
             else:
                 self.actions_input.setText(checkbox_actions)
     
+    def decode_poster_frame(self, video_path, media_path=None):
+        """Decode the poster frame of video_path, reading from media_path if given"""
+        # Remember the chosen frame by content so local copies and renames reuse it
+        return self.poster_frames.poster_frame(media_path or video_path, key=self.tag_key(video_path))
+    
     def show_thumbnail(self):
-        """Show a thumbnail of the first frame using OpenCV"""
+        """Show a thumbnail of the video's poster frame using OpenCV"""
         if not self.video_files:
             return
             
         try:
-            # Use OpenCV to get the first frame
-            cap = cv2.VideoCapture(self.video_files[self.current_index])
-            ret, frame = cap.read()
-            cap.release()
+            # Use the cached frame if it was prefetched, otherwise decode it now
+            video_path = self.video_files[self.current_index]
+            frame = self.thumbnail_cache.get(video_path)
+            if frame is None:
+                source_path, media_path = self.current_media_path
+                with self.metrics.time('thumbnail_decode'):
+                    frame = self.decode_poster_frame(video_path, media_path if source_path == video_path else None)
+                if frame is not None:
+                    self.thumbnail_cache.put(video_path, frame)
             
-            if ret:
-                # Resize frame to fit the display
-                frame = cv2.resize(frame, (640, 480))
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if frame is not None:
                 h, w, ch = frame.shape
                 bytes_per_line = ch * w
                 qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
@@ -570,6 +1983,7 @@ class VideoTagger(QMainWindow):
     
     def on_media_status_changed(self, status):
         if status == QMediaPlayer.MediaStatus.LoadedMedia:
+            self.metrics.finish('media_load')
             # Video loaded successfully, update progress slider
             duration = self.media_player.duration()
             if duration > 0:
@@ -597,7 +2011,78 @@ class VideoTagger(QMainWindow):
             self.progress_slider.setValue(position)
     
     def set_position(self, position):
-        self.media_player.setPosition(position)
+        if self.frame_buffer:
+            self.frame_buffer.seek(position)
+            self.show_step_frame()
+        else:
+            self.media_player.setPosition(position)
+    
+    def toggle_frame_step(self, checked):
+        if checked:
+            self.enter_frame_step()
+        else:
+            self.exit_frame_step()
+    
+    def enter_frame_step(self):
+        """Pause playback and serve frames from a decoded ring buffer around the playhead"""
+        if self.frame_buffer:
+            return
+        if not self.video_files:
+            self.frame_step_button.setChecked(False)
+            return
+        
+        self.media_player.pause()
+        buffer = FrameRingBuffer(self.current_media_path[1])
+        if not buffer.start(self.media_player.position()):
+            QMessageBox.warning(self, "Frame Step", "Could not decode this video for frame stepping.")
+            self.frame_step_button.setChecked(False)
+            return
+        self.frame_buffer = buffer
+        self.frame_step_button.setChecked(True)
+        self.show_step_frame()
+        self.update_ui()
+    
+    def exit_frame_step(self, seek=True):
+        """Leave frame-step mode, moving the player to the stepped-to position"""
+        if not self.frame_buffer:
+            return
+        buffer = self.frame_buffer
+        self.frame_buffer = None
+        buffer.stop()
+        if seek:
+            self.media_player.setPosition(int(buffer.position_ms()))
+            self.thumbnail_label.hide()
+            self.video_widget.show()
+        self.frame_position_label.setText("")
+        self.frame_step_button.setChecked(False)
+        self.update_ui()
+    
+    def step_frame(self, delta):
+        if not self.frame_buffer:
+            self.enter_frame_step()
+            if not self.frame_buffer:
+                return
+        self.frame_buffer.step(delta)
+        self.show_step_frame()
+    
+    def show_step_frame(self, attempts=0):
+        """Display the frame at the ring buffer cursor, waiting briefly if it is still decoding"""
+        if not self.frame_buffer:
+            return
+        current = self.frame_buffer.current()
+        if current is None:
+            if attempts < 200 and not self.frame_buffer.exhausted():
+                QTimer.singleShot(10, lambda: self.show_step_frame(attempts + 1))
+            return
+        
+        index, timestamp_ms, frame = current
+        h, w, ch = frame.shape
+        qt_image = QImage(frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
+        self.thumbnail_label.setPixmap(QPixmap.fromImage(qt_image))
+        self.thumbnail_label.show()
+        self.video_widget.hide()
+        self.progress_slider.setValue(int(timestamp_ms))
+        self.frame_position_label.setText(f"Frame {index} · {format_timestamp(timestamp_ms)}")
     
     def update_file_info(self):
         if self.video_files:
@@ -646,7 +2131,8 @@ class VideoTagger(QMainWindow):
         # Check if there's any content to save
         has_content = any(value for value in tag_data.values())
         if has_content:
-            self.tags[current_file] = tag_data
+            with self.metrics.time('autosave'):
+                self.store_tags(self.current_tag_key, tag_data, current_file)
             filename = os.path.basename(current_file)
             self.status_label.setText(f"✓ Auto-saved: {filename}")
             self.status_label.setStyleSheet("QLabel { padding: 3px; color: #4CAF50; font-size: 10px; }")
@@ -656,12 +2142,17 @@ class VideoTagger(QMainWindow):
             
             print(f"Auto-saved tags for: {filename}")
     
+    def store_tags(self, key, tag_data, video_path):
+        """Save a plain tag record under key, keeping the statistics columns in step"""
+        record = self.vocabulary.encode_record(tag_data)
+        self.tags[key] = record
+        self.tag_paths[key] = video_path
+        self.corpus.store(key, record)
+    
     def has_unsaved_changes(self):
         """Check if there are unsaved changes for the current video"""
         if not self.video_files:
             return False
-            
-        current_file = self.video_files[self.current_index]
         
         # Collect current tag data
         current_tag_data = {
@@ -687,10 +2178,10 @@ class VideoTagger(QMainWindow):
             return False
         
         # Compare with saved data
-        if current_file in self.tags:
-            saved_data = self.tags[current_file]
+        if self.current_tag_key in self.tags:
+            saved_data = self.tags[self.current_tag_key]
             if isinstance(saved_data, dict):
-                return current_tag_data != saved_data
+                return self.vocabulary.normalize_record(current_tag_data) != self.vocabulary.decode_record(saved_data)
             else:
                 # Legacy format - compare with general tags
                 return current_tag_data['general_tags'] != saved_data
@@ -699,7 +2190,10 @@ class VideoTagger(QMainWindow):
         return True
     
     def toggle_play(self):
-        if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+        if self.frame_buffer:
+            self.exit_frame_step()
+            self.media_player.play()
+        elif self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.media_player.pause()
         else:
             self.media_player.play()
@@ -729,8 +2223,8 @@ class VideoTagger(QMainWindow):
             # Only save if there's actual content
             has_content = any(value for value in tag_data.values())
             if has_content:
-                self.tags[current_file] = tag_data
-            QMessageBox.information(self, "Saved", "Tags saved successfully!")
+                self.store_tags(self.current_tag_key, tag_data, current_file)
+                QMessageBox.information(self, "Saved", "Tags saved successfully!")
             else:
                 QMessageBox.warning(self, "No Tags", "Please enter at least one tag before saving!")
     
@@ -741,75 +2235,211 @@ class VideoTagger(QMainWindow):
             
         file_path, _ = QFileDialog.getSaveFileName(self, "Export Tags", "", "CSV Files (*.csv)")
         if file_path:
-            # Prepare data for export
-            data = []
-            for file_path_key, tag_data in self.tags.items():
-                if isinstance(tag_data, dict):
-                    # New structured format
-                    row = {
-                        'file_path': file_path_key,
-                        'people': tag_data.get('people', ''),
-                        'key_moments': tag_data.get('moments', ''),
-                        'caption': tag_data.get('caption', ''),
-                        'location': tag_data.get('location', ''),
-                        'actions': tag_data.get('actions', ''),
-                        'movement': tag_data.get('movement', ''),
-                        'movement_description': tag_data.get('movement_description', ''),
-                        'content_movement': tag_data.get('content_movement', ''),
-                        'shot_type': tag_data.get('shot_type', ''),
-                        'handheld': tag_data.get('handheld', ''),
-                        'depth_of_field': tag_data.get('depth_of_field', ''),
-                        'color_scale': tag_data.get('color_scale', ''),
-                        'color_scale_description': tag_data.get('color_scale_description', ''),
-                        'general_tags': tag_data.get('general_tags', '')
-                    }
-                else:
-                    # Legacy format - convert to structured
-                    row = {
-                        'file_path': file_path_key,
-                        'people': '',
-                        'key_moments': '',
-                        'caption': '',
-                        'location': '',
-                        'actions': '',
-                        'movement': '',
-                        'movement_description': '',
-                        'content_movement': '',
-                        'shot_type': '',
-                        'handheld': '',
-                        'depth_of_field': '',
-                        'color_scale': '',
-                        'color_scale_description': '',
-                        'general_tags': tag_data
-                    }
-                data.append(row)
+            with self.metrics.time('export'):
+                # Prepare data for export
+                data = []
+                for tag_key, tag_data in self.tags.items():
+                    file_path_key = self.tag_paths.get(tag_key, tag_key)
+                    fingerprint = tag_key if tag_key != file_path_key else ''
+                    if isinstance(tag_data, dict):
+                        # New structured format
+                        tag_data = self.vocabulary.decode_record(tag_data)
+                        row = {
+                            'file_path': file_path_key,
+                            'people': tag_data.get('people', ''),
+                            'key_moments': tag_data.get('moments', ''),
+                            'caption': tag_data.get('caption', ''),
+                            'location': tag_data.get('location', ''),
+                            'actions': tag_data.get('actions', ''),
+                            'movement': tag_data.get('movement', ''),
+                            'movement_description': tag_data.get('movement_description', ''),
+                            'content_movement': tag_data.get('content_movement', ''),
+                            'shot_type': tag_data.get('shot_type', ''),
+                            'handheld': tag_data.get('handheld', ''),
+                            'depth_of_field': tag_data.get('depth_of_field', ''),
+                            'color_scale': tag_data.get('color_scale', ''),
+                            'color_scale_description': tag_data.get('color_scale_description', ''),
+                            'general_tags': tag_data.get('general_tags', ''),
+                            'fingerprint': fingerprint
+                        }
+                    else:
+                        # Legacy format - convert to structured
+                        row = {
+                            'file_path': file_path_key,
+                            'people': '',
+                            'key_moments': '',
+                            'caption': '',
+                            'location': '',
+                            'actions': '',
+                            'movement': '',
+                            'movement_description': '',
+                            'content_movement': '',
+                            'shot_type': '',
+                            'handheld': '',
+                            'depth_of_field': '',
+                            'color_scale': '',
+                            'color_scale_description': '',
+                            'general_tags': tag_data,
+                            'fingerprint': fingerprint
+                        }
+                    data.append(row)
             
-            df = pd.DataFrame(data)
-            # Use quoting=csv.QUOTE_ALL to ensure all fields are quoted consistently
-            df.to_csv(file_path, index=False, quoting=csv.QUOTE_ALL)
+                df = pd.DataFrame(data)
+                # Use quoting=csv.QUOTE_ALL to ensure all fields are quoted consistently
+                df.to_csv(file_path, index=False, quoting=csv.QUOTE_ALL)
             QMessageBox.information(self, "Exported", "Tags exported successfully!")
     
     def update_ui(self):
-        self.prev_button.setEnabled(self.current_index > 0)
-        self.next_button.setEnabled(self.current_index < len(self.video_files) - 1)
-        self.play_button.setEnabled(bool(self.video_files))
-        self.save_button.setEnabled(bool(self.video_files))
-        self.export_button.setEnabled(bool(self.tags))
-        self.select_dir_button.setEnabled(True)  # Always enabled
-        self.timestamp_button.setEnabled(bool(self.video_files))
-        
-        # Update save button text to indicate unsaved changes
-        if self.has_unsaved_changes():
-            self.save_button.setText("Save Tags*")
-            self.save_button.setStyleSheet("QPushButton { padding: 8px; background-color: #FF5722; color: white; border-radius: 3px; font-weight: bold; } QPushButton:hover { background-color: #E64A19; }")
-        else:
-            self.save_button.setText("Save Tags")
-            self.save_button.setStyleSheet("QPushButton { padding: 8px; background-color: #2196F3; color: white; border-radius: 3px; font-weight: bold; } QPushButton:hover { background-color: #1976D2; }")
+        with self.metrics.time('update_ui'):
+            self.prev_button.setEnabled(self.current_index > 0)
+            self.next_button.setEnabled(self.current_index < len(self.video_files) - 1)
+            self.play_button.setEnabled(bool(self.video_files))
+            self.save_button.setEnabled(bool(self.video_files))
+            self.export_button.setEnabled(bool(self.tags))
+            self.select_dir_button.setEnabled(True)  # Always enabled
+            self.contact_sheet_button.setEnabled(bool(self.video_files))
+            self.stats_button.setEnabled(bool(self.tags) and self.stats_future is None)
+            self.timestamp_button.setEnabled(bool(self.video_files))
+            self.frame_step_button.setEnabled(bool(self.video_files))
+            self.frame_back_button.setEnabled(bool(self.video_files))
+            self.frame_forward_button.setEnabled(bool(self.video_files))
+        
+            # Update save button text to indicate unsaved changes
+            if self.has_unsaved_changes():
+                self.save_button.setText("Save Tags*")
+                self.save_button.setStyleSheet("QPushButton { padding: 8px; background-color: #FF5722; color: white; border-radius: 3px; font-weight: bold; } QPushButton:hover { background-color: #E64A19; }")
+            else:
+                self.save_button.setText("Save Tags")
+                self.save_button.setStyleSheet("QPushButton { padding: 8px; background-color: #2196F3; color: white; border-radius: 3px; font-weight: bold; } QPushButton:hover { background-color: #1976D2; }")
         
-        if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            self.play_button.setText("Pause")
-        else:
-            self.play_button.setText("Play")
+            if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+                self.play_button.setText("Pause")
+            else:
+                self.play_button.setText("Play")
+    
+    def show_contact_sheet(self):
+        if not self.video_files:
+            return
+        if self.contact_sheet is None:
+            self.contact_sheet = ContactSheetDialog(self)
+        self.contact_sheet.model.set_page(self.current_index // self.contact_sheet.model.page_size)
+        self.contact_sheet.show()
+        self.contact_sheet.raise_()
+    
+    def apply_bulk_tags(self, video_paths, partial_record):
+        """Merge the non-empty fields of partial_record into the tags of every video in one pass"""
+        if not video_paths or not partial_record:
+            return 0
+        
+        # Keep anything typed for the current video before records change underneath it
+        self.auto_save_current_tags()
+        fingerprints = self.fingerprints.fingerprint_many(video_paths)
+        for video_path in video_paths:
+            key = fingerprints.get(video_path, video_path)
+            record = self.tags.get(key)
+            if isinstance(record, dict):
+                record = self.vocabulary.decode_record(record)
+            else:
+                # Untagged, or a legacy plain-text record kept as general tags
+                legacy_tags = record or ''
+                record = {field: '' for field in TAG_FIELDS}
+                record['general_tags'] = legacy_tags
+            record.update(partial_record)
+            self.store_tags(key, record, video_path)
+        
+        if self.video_files and self.video_files[self.current_index] in fingerprints:
+            self.load_current_video()
+        self.status_label.setText(f"✓ Bulk-tagged {len(video_paths)} video(s)")
+        self.status_label.setStyleSheet("QLabel { padding: 3px; color: #4CAF50; font-size: 10px; }")
+        QTimer.singleShot(3000, lambda: self.status_label.setText(""))
+        self.update_ui()
+        return len(video_paths)
+    
+    def show_corpus_stats(self):
+        """Show label distributions, co-occurrence and coverage for the tags in this session"""
+        self.auto_save_current_tags()
+        if not self.tags:
+            QMessageBox.warning(self, "No Tags", "No tags to analyse!")
+            return
+        
+        if self.stats_future is not None:
+            return  # Still computing the last request
+        
+        # The snapshot is a few array copies; the report runs off the GUI thread
+        table = self.corpus.table()
+        self.stats_future = self.stats_executor.submit(self._compute_corpus_report, table)
+        self.stats_button.setEnabled(False)
+        self.stats_button.setText("Computing Statistics...")
+        self.poll_corpus_stats()
+    
+    @staticmethod
+    def _compute_corpus_report(table):
+        start = time.perf_counter()
+        report = table.report()
+        return report, (time.perf_counter() - start) * 1000
+    
+    def poll_corpus_stats(self):
+        """Show the statistics dialog once the background report is ready"""
+        if not self.stats_future.done():
+            QTimer.singleShot(50, self.poll_corpus_stats)
+            return
+        future = self.stats_future
+        self.stats_future = None
+        self.stats_button.setText("Corpus Statistics")
+        self.stats_button.setEnabled(bool(self.tags))
+        try:
+            report, elapsed_ms = future.result()
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to compute statistics: {e}")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Corpus Statistics")
+        dialog.resize(700, 800)
+        layout = QVBoxLayout(dialog)
+        text = QTextEdit()
+        text.setReadOnly(True)
+        text.setStyleSheet("QTextEdit { font-family: monospace; font-size: 11px; }")
+        text.setPlainText(f"{report}\n\nComputed in {elapsed_ms:.0f} ms")
+        layout.addWidget(text)
+        dialog.show()
+    
+    def jump_to_video(self, video_path):
+        if video_path not in self.video_files:
+            return
+        self.auto_save_current_tags()
+        self.current_index = self.video_files.index(video_path)
+        self.load_current_video()
+        self.update_ui()
+    
+    def toggle_stats_overlay(self):
+        """Show or hide the latency overlay; showing it turns metrics collection on"""
+        if self.stats_overlay.isVisible():
+            self.stats_overlay.hide()
+            self.stats_timer.stop()
+            return
+        self.metrics.enabled = True
+        self.refresh_stats_overlay()
+        self.stats_overlay.show()
+        self.stats_overlay.raise_()
+        self.stats_timer.start()
+    
+    def refresh_stats_overlay(self):
+        text = self.metrics.summary_text()
+        if self.readahead_checkbox.isChecked():
+            stats = self.readahead_cache.stats()
+            text += f"\nread-ahead hit rate {stats['hit_rate']:.0%} ({stats['hits']}/{stats['hits'] + stats['misses']})"
+        self.stats_overlay.setText(text)
+        self.stats_overlay.adjustSize()
+        self.stats_overlay.move(10, 10)
+    
+    def dump_metrics(self):
+        if not self.metrics_path:
+            return
+        try:
+            self.metrics.write(self.metrics_path)
+        except OSError as e:
+            print(f"Error writing metrics to {self.metrics_path}: {e}")
     
     def closeEvent(self, event):
         # Auto-save any unsaved changes before closing
@@ -817,7 +2447,20 @@ class VideoTagger(QMainWindow):
             self.auto_save_current_tags()
             print("Auto-saved final changes before closing")
         
+        self.stop_watching()
+        self.exit_frame_step(seek=False)
+        self.thumbnail_cache.shutdown()
         self.media_player.stop()
+        self.readahead_cache.shutdown()
+        self.stats_executor.shutdown(wait=False, cancel_futures=True)
+        self.relink_executor.shutdown(wait=False, cancel_futures=True)
+        
+        self.metrics_timer.stop()
+        self.dump_metrics()
+        if self.profiler:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.profile_path)
+            print(f"Session profile written to {self.profile_path}")
         event.accept()
 
     def add_current_timestamp(self):
@@ -826,9 +2469,10 @@ class VideoTagger(QMainWindow):
             QMessageBox.information(self, "No Video", "Please select a video directory first.")
             return
             
-        if self.media_player.isPlaying() or self.media_player.position() > 0:
-            current_pos = self.media_player.position()
-            timestamp = str(timedelta(seconds=current_pos // 1000))
+        if self.frame_buffer or self.media_player.isPlaying() or self.media_player.position() > 0:
+            # Frame-step mode knows the exact timestamp of the displayed frame
+            current_pos = self.frame_buffer.position_ms() if self.frame_buffer else self.media_player.position()
+            timestamp = format_timestamp(current_pos)
             current_text = self.moments_input.toPlainText().strip()
             
             # Check if the timestamp already exists at the end to prevent duplicates
@@ -869,6 +2513,202 @@ class VideoTagger(QMainWindow):
         self.color_description.setVisible(text == "Other")
         self.update_ui()
 
+class ContactSheetModel(QAbstractListModel):
+    """One page of videos for the contact sheet
+
+    Thumbnails are converted to pixmaps lazily in data(), which the view only
+    calls for visible cells, and a page never exceeds page_size rows, so render
+    cost is bounded regardless of library size.
+    """
+
+    ICON_SIZE = QSize(192, 108)
+
+    def __init__(self, tagger, page_size=120):
+        super().__init__()
+        self.tagger = tagger
+        self.page_size = page_size
+        self.page = 0
+        self.paths = []
+        self.tagged = set()
+        self._pixmaps = {}
+        self._placeholder = QPixmap(self.ICON_SIZE)
+        self._placeholder.fill(Qt.GlobalColor.black)
+
+    def page_count(self):
+        return max(1, -(-len(self.tagger.video_files) // self.page_size))
+
+    def set_page(self, page):
+        self.beginResetModel()
+        self.page = max(0, min(page, self.page_count() - 1))
+        start = self.page * self.page_size
+        self.paths = self.tagger.video_files[start:start + self.page_size]
+        self._pixmaps = {}
+        self.refresh_tagged()
+        self.endResetModel()
+        missing = [path for path in self.paths if self.tagger.thumbnail_cache.get(path) is None]
+        self.tagger.thumbnail_cache.prefetch(missing)
+
+    def refresh_tagged(self):
+        fingerprints = self.tagger.fingerprints.fingerprint_many(self.paths)
+        self.tagged = {path for path, fp in fingerprints.items() if fp in self.tagger.tags}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self.paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return ("✓ " if path in self.tagged else "") + os.path.basename(path)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return path
+        if role == Qt.ItemDataRole.DecorationRole:
+            pixmap = self._pixmaps.get(path)
+            if pixmap is None:
+                frame = self.tagger.thumbnail_cache.get(path)
+                if frame is None:
+                    return self._placeholder
+                h, w, ch = frame.shape
+                qt_image = QImage(frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
+                pixmap = QPixmap.fromImage(qt_image).scaled(
+                    self.ICON_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                self._pixmaps[path] = pixmap
+            return pixmap
+        return None
+
+    def refresh_thumbnails(self):
+        """Repaint cells whose thumbnails finished prefetching; returns how many are still pending"""
+        pending = 0
+        for row, path in enumerate(self.paths):
+            if path in self._pixmaps:
+                continue
+            if self.tagger.thumbnail_cache.get(path) is not None:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+            else:
+                pending += 1
+        return pending
+
+
+class ContactSheetDialog(QDialog):
+    """Grid of video thumbnails for multi-selecting clips and tagging them in one batch"""
+
+    KEEP = ""  # Empty choice leaves the field untouched
+
+    def __init__(self, tagger):
+        super().__init__(tagger)
+        self.tagger = tagger
+        self.setWindowTitle("Contact Sheet")
+        self.resize(1200, 800)
+        layout = QHBoxLayout(self)
+        
+        # Thumbnail grid
+        grid_layout = QVBoxLayout()
+        self.model = ContactSheetModel(tagger)
+        self.view = QListView()
+        self.view.setViewMode(QListView.ViewMode.IconMode)
+        self.view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.view.setMovement(QListView.Movement.Static)
+        self.view.setUniformItemSizes(True)
+        self.view.setIconSize(ContactSheetModel.ICON_SIZE)
+        self.view.setGridSize(QSize(ContactSheetModel.ICON_SIZE.width() + 16, ContactSheetModel.ICON_SIZE.height() + 36))
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.view.setModel(self.model)
+        self.view.doubleClicked.connect(self.open_video)
+        grid_layout.addWidget(self.view)
+        
+        page_layout = QHBoxLayout()
+        self.prev_page_button = QPushButton("Previous Page")
+        self.next_page_button = QPushButton("Next Page")
+        self.page_label = QLabel("")
+        self.select_all_button = QPushButton("Select Page")
+        page_layout.addWidget(self.prev_page_button)
+        page_layout.addWidget(self.page_label)
+        page_layout.addWidget(self.next_page_button)
+        page_layout.addStretch()
+        page_layout.addWidget(self.select_all_button)
+        grid_layout.addLayout(page_layout)
+        layout.addLayout(grid_layout, stretch=1)
+        
+        # Partial tag record applied to the selection
+        form_group = QGroupBox("Apply to Selected")
+        form = QFormLayout(form_group)
+        self.field_inputs = {}
+        for field, label, options in (
+                ('location', "Location", tagger.location_classes),
+                ('shot_type', "Shot Type", tagger.shot_types),
+                ('content_movement', "Content Movement", tagger.content_movement_types),
+                ('handheld', "Handheld", tagger.handheld_options),
+                ('depth_of_field', "Depth of Field", tagger.depth_of_field_options),
+                ('color_scale', "Color Scale", tagger.color_scale_options)):
+            combo = QComboBox()
+            combo.addItems([self.KEEP] + options)
+            combo.setEditable(field == 'location')
+            combo.setPlaceholderText("(keep)")
+            form.addRow(label, combo)
+            self.field_inputs[field] = combo
+        for field, label in (('people', "People"), ('general_tags', "General Tags")):
+            line_edit = QLineEdit()
+            line_edit.setPlaceholderText("(keep)")
+            form.addRow(label, line_edit)
+            self.field_inputs[field] = line_edit
+        self.apply_button = QPushButton("Apply to Selected")
+        self.apply_button.setStyleSheet("QPushButton { padding: 8px; background-color: #4CAF50; color: white; border-radius: 3px; font-weight: bold; } QPushButton:hover { background-color: #45a049; }")
+        form.addRow(self.apply_button)
+        layout.addWidget(form_group)
+        
+        self.prev_page_button.clicked.connect(lambda: self.change_page(-1))
+        self.next_page_button.clicked.connect(lambda: self.change_page(1))
+        self.select_all_button.clicked.connect(self.view.selectAll)
+        self.apply_button.clicked.connect(self.apply_to_selection)
+        self.view.selectionModel().selectionChanged.connect(self.update_controls)
+        self.model.modelReset.connect(self.update_controls)
+        
+        # Pick up thumbnails as background prefetching completes
+        self.thumbnail_timer = QTimer()
+        self.thumbnail_timer.setInterval(200)
+        self.thumbnail_timer.timeout.connect(self.refresh_thumbnails)
+        self.model.modelReset.connect(self.thumbnail_timer.start)
+
+    def change_page(self, delta):
+        self.model.set_page(self.model.page + delta)
+
+    def refresh_thumbnails(self):
+        if not self.isVisible() or not self.model.refresh_thumbnails():
+            self.thumbnail_timer.stop()
+
+    def update_controls(self):
+        self.page_label.setText(f"Page {self.model.page + 1} of {self.model.page_count()}")
+        self.prev_page_button.setEnabled(self.model.page > 0)
+        self.next_page_button.setEnabled(self.model.page < self.model.page_count() - 1)
+        selected = len(self.view.selectionModel().selectedIndexes())
+        self.apply_button.setText(f"Apply to {selected} Selected")
+        self.apply_button.setEnabled(selected > 0)
+
+    def partial_record(self):
+        record = {}
+        for field, widget in self.field_inputs.items():
+            value = (widget.currentText() if isinstance(widget, QComboBox) else widget.text()).strip()
+            if value:
+                record[field] = value
+        return record
+
+    def apply_to_selection(self):
+        record = self.partial_record()
+        if not record:
+            QMessageBox.warning(self, "No Tags", "Fill in at least one field to apply!")
+            return
+        paths = [self.model.paths[index.row()] for index in self.view.selectionModel().selectedIndexes()]
+        self.tagger.apply_bulk_tags(paths, record)
+        self.model.refresh_tagged()
+        self.model.dataChanged.emit(self.model.index(0), self.model.index(self.model.rowCount() - 1),
+                                    [Qt.ItemDataRole.DisplayRole])
+
+    def open_video(self, index):
+        self.tagger.jump_to_video(self.model.paths[index.row()])
+
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     window = VideoTagger()